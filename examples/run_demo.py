@@ -5,7 +5,7 @@ Tiny entrypoint to run a few MCTS simulations and print a candidate sequence + r
 from __future__ import annotations
 from typing import Optional
 from topogenie.euler_mcts import EulerState, MCTS
-from topogenie.vocab import initial_adjacency
+from topogenie.vocab import ACT_END, decode_action, initial_adjacency
 
 def main(num_simulations: int = 200) -> None:
     # Start at VSS with only supplies in the graph
@@ -21,7 +21,7 @@ def main(num_simulations: int = 200) -> None:
         action = mcts.best_action(root, temperature=0.0)
         seq.append(action)
         state = state.apply(action)
-        if action == "END":
+        if action == ACT_END:
             break
 
     # Score the final state
@@ -30,7 +30,7 @@ def main(num_simulations: int = 200) -> None:
 
     print("Actions:")
     for i, a in enumerate(seq):
-        print(f"{i:02d}: {a}")
+        print(f"{i:02d}: {decode_action(a)}")
     print(f"Reward: {reward:.4f}")
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""
+Regenerate topogenie/_state_space_gen.py, the precomputed state space that
+topogenie.generate_state_space() loads. Run after editing the catalogs:
+
+    python scripts/gen_state_space.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import topogenie  # noqa: E402
+
+if __name__ == "__main__":
+    out = os.path.join(os.path.dirname(topogenie.__file__), "_state_space_gen.py")
+    ss = topogenie._build_state_space()
+    topogenie.save_state_space_module(out, ss)
+    print(f"wrote {out}: {topogenie.summary(ss)}")
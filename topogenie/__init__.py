@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 import json
+from pprint import pformat
 
 """
 Minimal state-space initializer per the user's pseudocode.
@@ -62,6 +63,9 @@ SINGLE_EXTERNALS = ("LOGICQA1", "LOGICQB1", "VHOLD1",)
 
 SPECIAL = ("VDD", "VSS", 'TRUNCATE')
 
+# Identifies the catalogs above; the generated module is only used when its key matches.
+CATALOG_KEY = repr((RANGES, PIN_ROLES, SINGLETONS, EXTERNALS, SINGLE_EXTERNALS, SPECIAL))
+
 
 # ------------------------------
 # State space container
@@ -80,6 +84,29 @@ class StateSpace:
 # ------------------------------
 
 def generate_state_space() -> StateSpace:
+    """
+    The catalogs are constants, so the result is precomputed into topogenie/_state_space_gen.py
+    (regenerate with scripts/gen_state_space.py). Falls back to building it when that module is
+    missing or was generated from different catalogs.
+    """
+    try:
+        from . import _state_space_gen as gen
+    except ImportError:
+        gen = None
+    if gen is None or gen.CATALOG_KEY != CATALOG_KEY:
+        return _build_state_space()
+
+    tokens = list(gen.TOKENS)
+    return StateSpace(
+        tokens=tokens,
+        tok2id={t: idx for idx, t in enumerate(tokens)},
+        id2tok=list(tokens),
+        groups={k: list(v) for k, v in gen.GROUPS.items()},
+        by_family={fam: {k: list(v) for k, v in d.items()} for fam, d in gen.BY_FAMILY.items()},
+    )
+
+
+def _build_state_space() -> StateSpace:
     tokens: List[str] = []
     groups = {"devices": [], "pins": [], "externals": [], "single_externals": [], "special": []}
     by_family: Dict[str, Dict[str, List[str]]] = {}
@@ -152,6 +179,18 @@ def save_state_space_json(path: str, ss: StateSpace):
         }, f, indent=2)
 
 
+def save_state_space_module(path: str, ss: StateSpace):
+    """Write `ss` as a Python module of literals (see generate_state_space)."""
+    with open(path, "w") as f:
+        f.write('"""Generated by scripts/gen_state_space.py from the catalogs in topogenie/__init__.py. Do not edit."""\n\n')
+        f.write(f"CATALOG_KEY = {CATALOG_KEY!r}\n\n")
+        f.write(f"TOKENS = {pformat(tuple(ss.tokens), width=100)}\n\n")
+        groups = {k: tuple(v) for k, v in ss.groups.items()}
+        f.write(f"GROUPS = {pformat(groups, width=100, sort_dicts=False)}\n\n")
+        by_family = {fam: {k: tuple(v) for k, v in d.items()} for fam, d in ss.by_family.items()}
+        f.write(f"BY_FAMILY = {pformat(by_family, width=100, sort_dicts=False)}\n")
+
+
 def summary(ss: StateSpace) -> str:
     return (
         f"total_tokens={len(ss.tokens)} | "
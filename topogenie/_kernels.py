@@ -0,0 +1,71 @@
+"""
+Numeric kernels for the MCTS hot loop.
+- select_child_ucb: argmax of Q + U over one contiguous child block of TreeArrays.
+- select_child_wu: the same with WU-UCT's in-flight (ongoing) counts in the U denominator.
+- backup_path: per-node visit/value update along a root→leaf path, plus each child
+  block's running visit total (filed under the block's owner, parent_idx of the child).
+
+Backends, in order of preference: the Cython core (_puct_core.pyx, if built), Numba,
+then plain Python. When neither compiled backend is present callers should prefer
+their vectorized NumPy path (see HAVE_KERNELS).
+"""
+
+from __future__ import annotations
+try:
+    from numba import njit  # type: ignore
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+@njit(cache=True)
+def select_child_ucb(priors, N, W, sq):
+    """Index of the child maximizing W/N + sq * P / (1 + N), sq = c * sqrt(parent_N); first wins on ties."""
+    best_i = 0
+    best_score = -1e30
+    for i in range(priors.shape[0]):
+        n = N[i]
+        q = W[i] / n if n > 0 else 0.0
+        score = q + sq * priors[i] / (1.0 + n)
+        if score > best_score:
+            best_i = i
+            best_score = score
+    return best_i
+
+@njit(cache=True)
+def select_child_wu(priors, N, W, O, sq):
+    """Index maximizing W/N + sq * P / (1 + N + O), sq = c * sqrt(parent_N + parent_O); first wins on ties."""
+    best_i = 0
+    best_score = -1e30
+    for i in range(priors.shape[0]):
+        n = N[i]
+        q = W[i] / n if n > 0 else 0.0
+        score = q + sq * priors[i] / (1.0 + n + O[i])
+        if score > best_score:
+            best_i = i
+            best_score = score
+    return best_i
+
+@njit(cache=True)
+def backup_path(path, visit_count, total_value, parent_idx, children_N, dN, dW):
+    """Add dN visits and dW value to every node id on `path` (root→leaf, no repeats), and dN to each one's block total."""
+    for k in range(path.shape[0]):
+        i = path[k]
+        visit_count[i] += dN
+        total_value[i] += dW
+        # also for path[0]: a reused tree's root can sit inside an existing block
+        if parent_idx[i] >= 0:
+            children_N[parent_idx[i]] += dN
+
+# The Cython core exposes the same functions; prefer it when it has been built
+try:
+    from ._puct_core import select_child_ucb, select_child_wu, backup_path  # type: ignore  # noqa: F811
+    HAVE_CORE = True
+except Exception:
+    HAVE_CORE = False
+
+HAVE_KERNELS = HAVE_CORE or HAVE_NUMBA
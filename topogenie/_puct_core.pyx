@@ -0,0 +1,51 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional compiled core for the MCTS numeric loops in _kernels.py: same signatures,
+strided memoryviews over the TreeArrays record fields, GIL released for the loop bodies.
+
+Build in place with:
+    cythonize -i topogenie/_puct_core.pyx
+
+When the extension is not built, _kernels falls back to Numba, then to plain Python.
+"""
+
+cpdef Py_ssize_t select_child_ucb(const float[:] priors, const int[:] N, const float[:] W, double sq):
+    """Index of the child maximizing W/N + sq * P / (1 + N), sq = c * sqrt(parent_N); first wins on ties."""
+    cdef Py_ssize_t i, best_i = 0
+    cdef double q, score, best_score = -1e30
+    with nogil:
+        for i in range(priors.shape[0]):
+            q = <double>W[i] / N[i] if N[i] > 0 else 0.0
+            score = q + sq * priors[i] / (1.0 + N[i])
+            if score > best_score:
+                best_i = i
+                best_score = score
+    return best_i
+
+cpdef Py_ssize_t select_child_wu(const float[:] priors, const int[:] N, const float[:] W, const int[:] O,
+                                 double sq):
+    """Index maximizing W/N + sq * P / (1 + N + O), sq = c * sqrt(parent_N + parent_O); first wins on ties."""
+    cdef Py_ssize_t i, best_i = 0
+    cdef double q, score, best_score = -1e30
+    with nogil:
+        for i in range(priors.shape[0]):
+            q = <double>W[i] / N[i] if N[i] > 0 else 0.0
+            score = q + sq * priors[i] / (1.0 + N[i] + O[i])
+            if score > best_score:
+                best_i = i
+                best_score = score
+    return best_i
+
+cpdef void backup_path(const int[::1] path, int[:] visit_count, float[:] total_value,
+                       const int[:] parent_idx, int[:] children_N, int dN, double dW):
+    """Add dN visits and dW value to every node id on `path` (root→leaf, no repeats), and dN to each one's block total."""
+    cdef Py_ssize_t k
+    cdef int i
+    with nogil:
+        for k in range(path.shape[0]):
+            i = path[k]
+            visit_count[i] += dN
+            total_value[i] += dW
+            # also for path[0]: a reused tree's root can sit inside an existing block
+            if parent_idx[i] >= 0:
+                children_N[parent_idx[i]] += dN
@@ -0,0 +1,2895 @@
+"""Generated by scripts/gen_state_space.py from the catalogs in topogenie/__init__.py. Do not edit."""
+
+CATALOG_KEY = "({'NM': 34, 'PM': 34, 'NPN': 26, 'PNP': 26, 'R': 27, 'C': 15, 'L': 23, 'DIO': 7, 'INVERTER': 10, 'TRANSMISSION_GATE': 12}, {'NM': ('D', 'G', 'S', 'B'), 'PM': ('D', 'G', 'S', 'B'), 'NPN': ('C', 'B', 'E'), 'PNP': ('C', 'B', 'E'), 'R': ('P', 'N'), 'C': ('P', 'N'), 'L': ('P', 'N'), 'DIO': ('P', 'N'), 'INVERTER': ('A', 'Q', 'VDD', 'VSS'), 'TRANSMISSION_GATE': ('A', 'B', 'C', 'VDD', 'VSS')}, {'XOR1': ('A', 'B', 'VDD', 'VSS', 'Y'), 'PFD1': ('A', 'B', 'QA', 'QB', 'VDD', 'VSS')}, {'VIN': 10, 'IIN': 2, 'VOUT': 6, 'IOUT': 4, 'VB': 10, 'IB': 6, 'VCONT': 20, 'VCLK': 8, 'VCM': 2, 'VREF': 2, 'IREF': 2, 'VRF': 2, 'VLO': 4, 'VIF': 2, 'VBB': 4, 'LOGICA': 2, 'LOGICB': 2, 'LOGICD': 2, 'LOGICF': 2, 'LOGICG': 2, 'LOGICQ': 2, 'VLATCH': 2, 'VTRACK': 2}, ('LOGICQA1', 'LOGICQB1', 'VHOLD1'), ('VDD', 'VSS', 'TRUNCATE'))"
+
+TOKENS = ('NM1',
+ 'NM1_D',
+ 'NM1_G',
+ 'NM1_S',
+ 'NM1_B',
+ 'NM2',
+ 'NM2_D',
+ 'NM2_G',
+ 'NM2_S',
+ 'NM2_B',
+ 'NM3',
+ 'NM3_D',
+ 'NM3_G',
+ 'NM3_S',
+ 'NM3_B',
+ 'NM4',
+ 'NM4_D',
+ 'NM4_G',
+ 'NM4_S',
+ 'NM4_B',
+ 'NM5',
+ 'NM5_D',
+ 'NM5_G',
+ 'NM5_S',
+ 'NM5_B',
+ 'NM6',
+ 'NM6_D',
+ 'NM6_G',
+ 'NM6_S',
+ 'NM6_B',
+ 'NM7',
+ 'NM7_D',
+ 'NM7_G',
+ 'NM7_S',
+ 'NM7_B',
+ 'NM8',
+ 'NM8_D',
+ 'NM8_G',
+ 'NM8_S',
+ 'NM8_B',
+ 'NM9',
+ 'NM9_D',
+ 'NM9_G',
+ 'NM9_S',
+ 'NM9_B',
+ 'NM10',
+ 'NM10_D',
+ 'NM10_G',
+ 'NM10_S',
+ 'NM10_B',
+ 'NM11',
+ 'NM11_D',
+ 'NM11_G',
+ 'NM11_S',
+ 'NM11_B',
+ 'NM12',
+ 'NM12_D',
+ 'NM12_G',
+ 'NM12_S',
+ 'NM12_B',
+ 'NM13',
+ 'NM13_D',
+ 'NM13_G',
+ 'NM13_S',
+ 'NM13_B',
+ 'NM14',
+ 'NM14_D',
+ 'NM14_G',
+ 'NM14_S',
+ 'NM14_B',
+ 'NM15',
+ 'NM15_D',
+ 'NM15_G',
+ 'NM15_S',
+ 'NM15_B',
+ 'NM16',
+ 'NM16_D',
+ 'NM16_G',
+ 'NM16_S',
+ 'NM16_B',
+ 'NM17',
+ 'NM17_D',
+ 'NM17_G',
+ 'NM17_S',
+ 'NM17_B',
+ 'NM18',
+ 'NM18_D',
+ 'NM18_G',
+ 'NM18_S',
+ 'NM18_B',
+ 'NM19',
+ 'NM19_D',
+ 'NM19_G',
+ 'NM19_S',
+ 'NM19_B',
+ 'NM20',
+ 'NM20_D',
+ 'NM20_G',
+ 'NM20_S',
+ 'NM20_B',
+ 'NM21',
+ 'NM21_D',
+ 'NM21_G',
+ 'NM21_S',
+ 'NM21_B',
+ 'NM22',
+ 'NM22_D',
+ 'NM22_G',
+ 'NM22_S',
+ 'NM22_B',
+ 'NM23',
+ 'NM23_D',
+ 'NM23_G',
+ 'NM23_S',
+ 'NM23_B',
+ 'NM24',
+ 'NM24_D',
+ 'NM24_G',
+ 'NM24_S',
+ 'NM24_B',
+ 'NM25',
+ 'NM25_D',
+ 'NM25_G',
+ 'NM25_S',
+ 'NM25_B',
+ 'NM26',
+ 'NM26_D',
+ 'NM26_G',
+ 'NM26_S',
+ 'NM26_B',
+ 'NM27',
+ 'NM27_D',
+ 'NM27_G',
+ 'NM27_S',
+ 'NM27_B',
+ 'NM28',
+ 'NM28_D',
+ 'NM28_G',
+ 'NM28_S',
+ 'NM28_B',
+ 'NM29',
+ 'NM29_D',
+ 'NM29_G',
+ 'NM29_S',
+ 'NM29_B',
+ 'NM30',
+ 'NM30_D',
+ 'NM30_G',
+ 'NM30_S',
+ 'NM30_B',
+ 'NM31',
+ 'NM31_D',
+ 'NM31_G',
+ 'NM31_S',
+ 'NM31_B',
+ 'NM32',
+ 'NM32_D',
+ 'NM32_G',
+ 'NM32_S',
+ 'NM32_B',
+ 'NM33',
+ 'NM33_D',
+ 'NM33_G',
+ 'NM33_S',
+ 'NM33_B',
+ 'NM34',
+ 'NM34_D',
+ 'NM34_G',
+ 'NM34_S',
+ 'NM34_B',
+ 'PM1',
+ 'PM1_D',
+ 'PM1_G',
+ 'PM1_S',
+ 'PM1_B',
+ 'PM2',
+ 'PM2_D',
+ 'PM2_G',
+ 'PM2_S',
+ 'PM2_B',
+ 'PM3',
+ 'PM3_D',
+ 'PM3_G',
+ 'PM3_S',
+ 'PM3_B',
+ 'PM4',
+ 'PM4_D',
+ 'PM4_G',
+ 'PM4_S',
+ 'PM4_B',
+ 'PM5',
+ 'PM5_D',
+ 'PM5_G',
+ 'PM5_S',
+ 'PM5_B',
+ 'PM6',
+ 'PM6_D',
+ 'PM6_G',
+ 'PM6_S',
+ 'PM6_B',
+ 'PM7',
+ 'PM7_D',
+ 'PM7_G',
+ 'PM7_S',
+ 'PM7_B',
+ 'PM8',
+ 'PM8_D',
+ 'PM8_G',
+ 'PM8_S',
+ 'PM8_B',
+ 'PM9',
+ 'PM9_D',
+ 'PM9_G',
+ 'PM9_S',
+ 'PM9_B',
+ 'PM10',
+ 'PM10_D',
+ 'PM10_G',
+ 'PM10_S',
+ 'PM10_B',
+ 'PM11',
+ 'PM11_D',
+ 'PM11_G',
+ 'PM11_S',
+ 'PM11_B',
+ 'PM12',
+ 'PM12_D',
+ 'PM12_G',
+ 'PM12_S',
+ 'PM12_B',
+ 'PM13',
+ 'PM13_D',
+ 'PM13_G',
+ 'PM13_S',
+ 'PM13_B',
+ 'PM14',
+ 'PM14_D',
+ 'PM14_G',
+ 'PM14_S',
+ 'PM14_B',
+ 'PM15',
+ 'PM15_D',
+ 'PM15_G',
+ 'PM15_S',
+ 'PM15_B',
+ 'PM16',
+ 'PM16_D',
+ 'PM16_G',
+ 'PM16_S',
+ 'PM16_B',
+ 'PM17',
+ 'PM17_D',
+ 'PM17_G',
+ 'PM17_S',
+ 'PM17_B',
+ 'PM18',
+ 'PM18_D',
+ 'PM18_G',
+ 'PM18_S',
+ 'PM18_B',
+ 'PM19',
+ 'PM19_D',
+ 'PM19_G',
+ 'PM19_S',
+ 'PM19_B',
+ 'PM20',
+ 'PM20_D',
+ 'PM20_G',
+ 'PM20_S',
+ 'PM20_B',
+ 'PM21',
+ 'PM21_D',
+ 'PM21_G',
+ 'PM21_S',
+ 'PM21_B',
+ 'PM22',
+ 'PM22_D',
+ 'PM22_G',
+ 'PM22_S',
+ 'PM22_B',
+ 'PM23',
+ 'PM23_D',
+ 'PM23_G',
+ 'PM23_S',
+ 'PM23_B',
+ 'PM24',
+ 'PM24_D',
+ 'PM24_G',
+ 'PM24_S',
+ 'PM24_B',
+ 'PM25',
+ 'PM25_D',
+ 'PM25_G',
+ 'PM25_S',
+ 'PM25_B',
+ 'PM26',
+ 'PM26_D',
+ 'PM26_G',
+ 'PM26_S',
+ 'PM26_B',
+ 'PM27',
+ 'PM27_D',
+ 'PM27_G',
+ 'PM27_S',
+ 'PM27_B',
+ 'PM28',
+ 'PM28_D',
+ 'PM28_G',
+ 'PM28_S',
+ 'PM28_B',
+ 'PM29',
+ 'PM29_D',
+ 'PM29_G',
+ 'PM29_S',
+ 'PM29_B',
+ 'PM30',
+ 'PM30_D',
+ 'PM30_G',
+ 'PM30_S',
+ 'PM30_B',
+ 'PM31',
+ 'PM31_D',
+ 'PM31_G',
+ 'PM31_S',
+ 'PM31_B',
+ 'PM32',
+ 'PM32_D',
+ 'PM32_G',
+ 'PM32_S',
+ 'PM32_B',
+ 'PM33',
+ 'PM33_D',
+ 'PM33_G',
+ 'PM33_S',
+ 'PM33_B',
+ 'PM34',
+ 'PM34_D',
+ 'PM34_G',
+ 'PM34_S',
+ 'PM34_B',
+ 'NPN1',
+ 'NPN1_C',
+ 'NPN1_B',
+ 'NPN1_E',
+ 'NPN2',
+ 'NPN2_C',
+ 'NPN2_B',
+ 'NPN2_E',
+ 'NPN3',
+ 'NPN3_C',
+ 'NPN3_B',
+ 'NPN3_E',
+ 'NPN4',
+ 'NPN4_C',
+ 'NPN4_B',
+ 'NPN4_E',
+ 'NPN5',
+ 'NPN5_C',
+ 'NPN5_B',
+ 'NPN5_E',
+ 'NPN6',
+ 'NPN6_C',
+ 'NPN6_B',
+ 'NPN6_E',
+ 'NPN7',
+ 'NPN7_C',
+ 'NPN7_B',
+ 'NPN7_E',
+ 'NPN8',
+ 'NPN8_C',
+ 'NPN8_B',
+ 'NPN8_E',
+ 'NPN9',
+ 'NPN9_C',
+ 'NPN9_B',
+ 'NPN9_E',
+ 'NPN10',
+ 'NPN10_C',
+ 'NPN10_B',
+ 'NPN10_E',
+ 'NPN11',
+ 'NPN11_C',
+ 'NPN11_B',
+ 'NPN11_E',
+ 'NPN12',
+ 'NPN12_C',
+ 'NPN12_B',
+ 'NPN12_E',
+ 'NPN13',
+ 'NPN13_C',
+ 'NPN13_B',
+ 'NPN13_E',
+ 'NPN14',
+ 'NPN14_C',
+ 'NPN14_B',
+ 'NPN14_E',
+ 'NPN15',
+ 'NPN15_C',
+ 'NPN15_B',
+ 'NPN15_E',
+ 'NPN16',
+ 'NPN16_C',
+ 'NPN16_B',
+ 'NPN16_E',
+ 'NPN17',
+ 'NPN17_C',
+ 'NPN17_B',
+ 'NPN17_E',
+ 'NPN18',
+ 'NPN18_C',
+ 'NPN18_B',
+ 'NPN18_E',
+ 'NPN19',
+ 'NPN19_C',
+ 'NPN19_B',
+ 'NPN19_E',
+ 'NPN20',
+ 'NPN20_C',
+ 'NPN20_B',
+ 'NPN20_E',
+ 'NPN21',
+ 'NPN21_C',
+ 'NPN21_B',
+ 'NPN21_E',
+ 'NPN22',
+ 'NPN22_C',
+ 'NPN22_B',
+ 'NPN22_E',
+ 'NPN23',
+ 'NPN23_C',
+ 'NPN23_B',
+ 'NPN23_E',
+ 'NPN24',
+ 'NPN24_C',
+ 'NPN24_B',
+ 'NPN24_E',
+ 'NPN25',
+ 'NPN25_C',
+ 'NPN25_B',
+ 'NPN25_E',
+ 'NPN26',
+ 'NPN26_C',
+ 'NPN26_B',
+ 'NPN26_E',
+ 'PNP1',
+ 'PNP1_C',
+ 'PNP1_B',
+ 'PNP1_E',
+ 'PNP2',
+ 'PNP2_C',
+ 'PNP2_B',
+ 'PNP2_E',
+ 'PNP3',
+ 'PNP3_C',
+ 'PNP3_B',
+ 'PNP3_E',
+ 'PNP4',
+ 'PNP4_C',
+ 'PNP4_B',
+ 'PNP4_E',
+ 'PNP5',
+ 'PNP5_C',
+ 'PNP5_B',
+ 'PNP5_E',
+ 'PNP6',
+ 'PNP6_C',
+ 'PNP6_B',
+ 'PNP6_E',
+ 'PNP7',
+ 'PNP7_C',
+ 'PNP7_B',
+ 'PNP7_E',
+ 'PNP8',
+ 'PNP8_C',
+ 'PNP8_B',
+ 'PNP8_E',
+ 'PNP9',
+ 'PNP9_C',
+ 'PNP9_B',
+ 'PNP9_E',
+ 'PNP10',
+ 'PNP10_C',
+ 'PNP10_B',
+ 'PNP10_E',
+ 'PNP11',
+ 'PNP11_C',
+ 'PNP11_B',
+ 'PNP11_E',
+ 'PNP12',
+ 'PNP12_C',
+ 'PNP12_B',
+ 'PNP12_E',
+ 'PNP13',
+ 'PNP13_C',
+ 'PNP13_B',
+ 'PNP13_E',
+ 'PNP14',
+ 'PNP14_C',
+ 'PNP14_B',
+ 'PNP14_E',
+ 'PNP15',
+ 'PNP15_C',
+ 'PNP15_B',
+ 'PNP15_E',
+ 'PNP16',
+ 'PNP16_C',
+ 'PNP16_B',
+ 'PNP16_E',
+ 'PNP17',
+ 'PNP17_C',
+ 'PNP17_B',
+ 'PNP17_E',
+ 'PNP18',
+ 'PNP18_C',
+ 'PNP18_B',
+ 'PNP18_E',
+ 'PNP19',
+ 'PNP19_C',
+ 'PNP19_B',
+ 'PNP19_E',
+ 'PNP20',
+ 'PNP20_C',
+ 'PNP20_B',
+ 'PNP20_E',
+ 'PNP21',
+ 'PNP21_C',
+ 'PNP21_B',
+ 'PNP21_E',
+ 'PNP22',
+ 'PNP22_C',
+ 'PNP22_B',
+ 'PNP22_E',
+ 'PNP23',
+ 'PNP23_C',
+ 'PNP23_B',
+ 'PNP23_E',
+ 'PNP24',
+ 'PNP24_C',
+ 'PNP24_B',
+ 'PNP24_E',
+ 'PNP25',
+ 'PNP25_C',
+ 'PNP25_B',
+ 'PNP25_E',
+ 'PNP26',
+ 'PNP26_C',
+ 'PNP26_B',
+ 'PNP26_E',
+ 'R1',
+ 'R1_P',
+ 'R1_N',
+ 'R2',
+ 'R2_P',
+ 'R2_N',
+ 'R3',
+ 'R3_P',
+ 'R3_N',
+ 'R4',
+ 'R4_P',
+ 'R4_N',
+ 'R5',
+ 'R5_P',
+ 'R5_N',
+ 'R6',
+ 'R6_P',
+ 'R6_N',
+ 'R7',
+ 'R7_P',
+ 'R7_N',
+ 'R8',
+ 'R8_P',
+ 'R8_N',
+ 'R9',
+ 'R9_P',
+ 'R9_N',
+ 'R10',
+ 'R10_P',
+ 'R10_N',
+ 'R11',
+ 'R11_P',
+ 'R11_N',
+ 'R12',
+ 'R12_P',
+ 'R12_N',
+ 'R13',
+ 'R13_P',
+ 'R13_N',
+ 'R14',
+ 'R14_P',
+ 'R14_N',
+ 'R15',
+ 'R15_P',
+ 'R15_N',
+ 'R16',
+ 'R16_P',
+ 'R16_N',
+ 'R17',
+ 'R17_P',
+ 'R17_N',
+ 'R18',
+ 'R18_P',
+ 'R18_N',
+ 'R19',
+ 'R19_P',
+ 'R19_N',
+ 'R20',
+ 'R20_P',
+ 'R20_N',
+ 'R21',
+ 'R21_P',
+ 'R21_N',
+ 'R22',
+ 'R22_P',
+ 'R22_N',
+ 'R23',
+ 'R23_P',
+ 'R23_N',
+ 'R24',
+ 'R24_P',
+ 'R24_N',
+ 'R25',
+ 'R25_P',
+ 'R25_N',
+ 'R26',
+ 'R26_P',
+ 'R26_N',
+ 'R27',
+ 'R27_P',
+ 'R27_N',
+ 'C1',
+ 'C1_P',
+ 'C1_N',
+ 'C2',
+ 'C2_P',
+ 'C2_N',
+ 'C3',
+ 'C3_P',
+ 'C3_N',
+ 'C4',
+ 'C4_P',
+ 'C4_N',
+ 'C5',
+ 'C5_P',
+ 'C5_N',
+ 'C6',
+ 'C6_P',
+ 'C6_N',
+ 'C7',
+ 'C7_P',
+ 'C7_N',
+ 'C8',
+ 'C8_P',
+ 'C8_N',
+ 'C9',
+ 'C9_P',
+ 'C9_N',
+ 'C10',
+ 'C10_P',
+ 'C10_N',
+ 'C11',
+ 'C11_P',
+ 'C11_N',
+ 'C12',
+ 'C12_P',
+ 'C12_N',
+ 'C13',
+ 'C13_P',
+ 'C13_N',
+ 'C14',
+ 'C14_P',
+ 'C14_N',
+ 'C15',
+ 'C15_P',
+ 'C15_N',
+ 'L1',
+ 'L1_P',
+ 'L1_N',
+ 'L2',
+ 'L2_P',
+ 'L2_N',
+ 'L3',
+ 'L3_P',
+ 'L3_N',
+ 'L4',
+ 'L4_P',
+ 'L4_N',
+ 'L5',
+ 'L5_P',
+ 'L5_N',
+ 'L6',
+ 'L6_P',
+ 'L6_N',
+ 'L7',
+ 'L7_P',
+ 'L7_N',
+ 'L8',
+ 'L8_P',
+ 'L8_N',
+ 'L9',
+ 'L9_P',
+ 'L9_N',
+ 'L10',
+ 'L10_P',
+ 'L10_N',
+ 'L11',
+ 'L11_P',
+ 'L11_N',
+ 'L12',
+ 'L12_P',
+ 'L12_N',
+ 'L13',
+ 'L13_P',
+ 'L13_N',
+ 'L14',
+ 'L14_P',
+ 'L14_N',
+ 'L15',
+ 'L15_P',
+ 'L15_N',
+ 'L16',
+ 'L16_P',
+ 'L16_N',
+ 'L17',
+ 'L17_P',
+ 'L17_N',
+ 'L18',
+ 'L18_P',
+ 'L18_N',
+ 'L19',
+ 'L19_P',
+ 'L19_N',
+ 'L20',
+ 'L20_P',
+ 'L20_N',
+ 'L21',
+ 'L21_P',
+ 'L21_N',
+ 'L22',
+ 'L22_P',
+ 'L22_N',
+ 'L23',
+ 'L23_P',
+ 'L23_N',
+ 'DIO1',
+ 'DIO1_P',
+ 'DIO1_N',
+ 'DIO2',
+ 'DIO2_P',
+ 'DIO2_N',
+ 'DIO3',
+ 'DIO3_P',
+ 'DIO3_N',
+ 'DIO4',
+ 'DIO4_P',
+ 'DIO4_N',
+ 'DIO5',
+ 'DIO5_P',
+ 'DIO5_N',
+ 'DIO6',
+ 'DIO6_P',
+ 'DIO6_N',
+ 'DIO7',
+ 'DIO7_P',
+ 'DIO7_N',
+ 'INVERTER1',
+ 'INVERTER1_A',
+ 'INVERTER1_Q',
+ 'INVERTER1_VDD',
+ 'INVERTER1_VSS',
+ 'INVERTER2',
+ 'INVERTER2_A',
+ 'INVERTER2_Q',
+ 'INVERTER2_VDD',
+ 'INVERTER2_VSS',
+ 'INVERTER3',
+ 'INVERTER3_A',
+ 'INVERTER3_Q',
+ 'INVERTER3_VDD',
+ 'INVERTER3_VSS',
+ 'INVERTER4',
+ 'INVERTER4_A',
+ 'INVERTER4_Q',
+ 'INVERTER4_VDD',
+ 'INVERTER4_VSS',
+ 'INVERTER5',
+ 'INVERTER5_A',
+ 'INVERTER5_Q',
+ 'INVERTER5_VDD',
+ 'INVERTER5_VSS',
+ 'INVERTER6',
+ 'INVERTER6_A',
+ 'INVERTER6_Q',
+ 'INVERTER6_VDD',
+ 'INVERTER6_VSS',
+ 'INVERTER7',
+ 'INVERTER7_A',
+ 'INVERTER7_Q',
+ 'INVERTER7_VDD',
+ 'INVERTER7_VSS',
+ 'INVERTER8',
+ 'INVERTER8_A',
+ 'INVERTER8_Q',
+ 'INVERTER8_VDD',
+ 'INVERTER8_VSS',
+ 'INVERTER9',
+ 'INVERTER9_A',
+ 'INVERTER9_Q',
+ 'INVERTER9_VDD',
+ 'INVERTER9_VSS',
+ 'INVERTER10',
+ 'INVERTER10_A',
+ 'INVERTER10_Q',
+ 'INVERTER10_VDD',
+ 'INVERTER10_VSS',
+ 'TRANSMISSION_GATE1',
+ 'TRANSMISSION_GATE1_A',
+ 'TRANSMISSION_GATE1_B',
+ 'TRANSMISSION_GATE1_C',
+ 'TRANSMISSION_GATE1_VDD',
+ 'TRANSMISSION_GATE1_VSS',
+ 'TRANSMISSION_GATE2',
+ 'TRANSMISSION_GATE2_A',
+ 'TRANSMISSION_GATE2_B',
+ 'TRANSMISSION_GATE2_C',
+ 'TRANSMISSION_GATE2_VDD',
+ 'TRANSMISSION_GATE2_VSS',
+ 'TRANSMISSION_GATE3',
+ 'TRANSMISSION_GATE3_A',
+ 'TRANSMISSION_GATE3_B',
+ 'TRANSMISSION_GATE3_C',
+ 'TRANSMISSION_GATE3_VDD',
+ 'TRANSMISSION_GATE3_VSS',
+ 'TRANSMISSION_GATE4',
+ 'TRANSMISSION_GATE4_A',
+ 'TRANSMISSION_GATE4_B',
+ 'TRANSMISSION_GATE4_C',
+ 'TRANSMISSION_GATE4_VDD',
+ 'TRANSMISSION_GATE4_VSS',
+ 'TRANSMISSION_GATE5',
+ 'TRANSMISSION_GATE5_A',
+ 'TRANSMISSION_GATE5_B',
+ 'TRANSMISSION_GATE5_C',
+ 'TRANSMISSION_GATE5_VDD',
+ 'TRANSMISSION_GATE5_VSS',
+ 'TRANSMISSION_GATE6',
+ 'TRANSMISSION_GATE6_A',
+ 'TRANSMISSION_GATE6_B',
+ 'TRANSMISSION_GATE6_C',
+ 'TRANSMISSION_GATE6_VDD',
+ 'TRANSMISSION_GATE6_VSS',
+ 'TRANSMISSION_GATE7',
+ 'TRANSMISSION_GATE7_A',
+ 'TRANSMISSION_GATE7_B',
+ 'TRANSMISSION_GATE7_C',
+ 'TRANSMISSION_GATE7_VDD',
+ 'TRANSMISSION_GATE7_VSS',
+ 'TRANSMISSION_GATE8',
+ 'TRANSMISSION_GATE8_A',
+ 'TRANSMISSION_GATE8_B',
+ 'TRANSMISSION_GATE8_C',
+ 'TRANSMISSION_GATE8_VDD',
+ 'TRANSMISSION_GATE8_VSS',
+ 'TRANSMISSION_GATE9',
+ 'TRANSMISSION_GATE9_A',
+ 'TRANSMISSION_GATE9_B',
+ 'TRANSMISSION_GATE9_C',
+ 'TRANSMISSION_GATE9_VDD',
+ 'TRANSMISSION_GATE9_VSS',
+ 'TRANSMISSION_GATE10',
+ 'TRANSMISSION_GATE10_A',
+ 'TRANSMISSION_GATE10_B',
+ 'TRANSMISSION_GATE10_C',
+ 'TRANSMISSION_GATE10_VDD',
+ 'TRANSMISSION_GATE10_VSS',
+ 'TRANSMISSION_GATE11',
+ 'TRANSMISSION_GATE11_A',
+ 'TRANSMISSION_GATE11_B',
+ 'TRANSMISSION_GATE11_C',
+ 'TRANSMISSION_GATE11_VDD',
+ 'TRANSMISSION_GATE11_VSS',
+ 'TRANSMISSION_GATE12',
+ 'TRANSMISSION_GATE12_A',
+ 'TRANSMISSION_GATE12_B',
+ 'TRANSMISSION_GATE12_C',
+ 'TRANSMISSION_GATE12_VDD',
+ 'TRANSMISSION_GATE12_VSS',
+ 'XOR1',
+ 'XOR1_A',
+ 'XOR1_B',
+ 'XOR1_VDD',
+ 'XOR1_VSS',
+ 'XOR1_Y',
+ 'PFD1',
+ 'PFD1_A',
+ 'PFD1_B',
+ 'PFD1_QA',
+ 'PFD1_QB',
+ 'PFD1_VDD',
+ 'PFD1_VSS',
+ 'VIN1',
+ 'VIN2',
+ 'VIN3',
+ 'VIN4',
+ 'VIN5',
+ 'VIN6',
+ 'VIN7',
+ 'VIN8',
+ 'VIN9',
+ 'VIN10',
+ 'IIN1',
+ 'IIN2',
+ 'VOUT1',
+ 'VOUT2',
+ 'VOUT3',
+ 'VOUT4',
+ 'VOUT5',
+ 'VOUT6',
+ 'IOUT1',
+ 'IOUT2',
+ 'IOUT3',
+ 'IOUT4',
+ 'VB1',
+ 'VB2',
+ 'VB3',
+ 'VB4',
+ 'VB5',
+ 'VB6',
+ 'VB7',
+ 'VB8',
+ 'VB9',
+ 'VB10',
+ 'IB1',
+ 'IB2',
+ 'IB3',
+ 'IB4',
+ 'IB5',
+ 'IB6',
+ 'VCONT1',
+ 'VCONT2',
+ 'VCONT3',
+ 'VCONT4',
+ 'VCONT5',
+ 'VCONT6',
+ 'VCONT7',
+ 'VCONT8',
+ 'VCONT9',
+ 'VCONT10',
+ 'VCONT11',
+ 'VCONT12',
+ 'VCONT13',
+ 'VCONT14',
+ 'VCONT15',
+ 'VCONT16',
+ 'VCONT17',
+ 'VCONT18',
+ 'VCONT19',
+ 'VCONT20',
+ 'VCLK1',
+ 'VCLK2',
+ 'VCLK3',
+ 'VCLK4',
+ 'VCLK5',
+ 'VCLK6',
+ 'VCLK7',
+ 'VCLK8',
+ 'VCM1',
+ 'VCM2',
+ 'VREF1',
+ 'VREF2',
+ 'IREF1',
+ 'IREF2',
+ 'VRF1',
+ 'VRF2',
+ 'VLO1',
+ 'VLO2',
+ 'VLO3',
+ 'VLO4',
+ 'VIF1',
+ 'VIF2',
+ 'VBB1',
+ 'VBB2',
+ 'VBB3',
+ 'VBB4',
+ 'LOGICA1',
+ 'LOGICA2',
+ 'LOGICB1',
+ 'LOGICB2',
+ 'LOGICD1',
+ 'LOGICD2',
+ 'LOGICF1',
+ 'LOGICF2',
+ 'LOGICG1',
+ 'LOGICG2',
+ 'LOGICQ1',
+ 'LOGICQ2',
+ 'VLATCH1',
+ 'VLATCH2',
+ 'VTRACK1',
+ 'VTRACK2',
+ 'LOGICQA1',
+ 'LOGICQB1',
+ 'VHOLD1',
+ 'VDD',
+ 'VSS',
+ 'TRUNCATE')
+
+GROUPS = {'devices': ('NM1',
+             'NM2',
+             'NM3',
+             'NM4',
+             'NM5',
+             'NM6',
+             'NM7',
+             'NM8',
+             'NM9',
+             'NM10',
+             'NM11',
+             'NM12',
+             'NM13',
+             'NM14',
+             'NM15',
+             'NM16',
+             'NM17',
+             'NM18',
+             'NM19',
+             'NM20',
+             'NM21',
+             'NM22',
+             'NM23',
+             'NM24',
+             'NM25',
+             'NM26',
+             'NM27',
+             'NM28',
+             'NM29',
+             'NM30',
+             'NM31',
+             'NM32',
+             'NM33',
+             'NM34',
+             'PM1',
+             'PM2',
+             'PM3',
+             'PM4',
+             'PM5',
+             'PM6',
+             'PM7',
+             'PM8',
+             'PM9',
+             'PM10',
+             'PM11',
+             'PM12',
+             'PM13',
+             'PM14',
+             'PM15',
+             'PM16',
+             'PM17',
+             'PM18',
+             'PM19',
+             'PM20',
+             'PM21',
+             'PM22',
+             'PM23',
+             'PM24',
+             'PM25',
+             'PM26',
+             'PM27',
+             'PM28',
+             'PM29',
+             'PM30',
+             'PM31',
+             'PM32',
+             'PM33',
+             'PM34',
+             'NPN1',
+             'NPN2',
+             'NPN3',
+             'NPN4',
+             'NPN5',
+             'NPN6',
+             'NPN7',
+             'NPN8',
+             'NPN9',
+             'NPN10',
+             'NPN11',
+             'NPN12',
+             'NPN13',
+             'NPN14',
+             'NPN15',
+             'NPN16',
+             'NPN17',
+             'NPN18',
+             'NPN19',
+             'NPN20',
+             'NPN21',
+             'NPN22',
+             'NPN23',
+             'NPN24',
+             'NPN25',
+             'NPN26',
+             'PNP1',
+             'PNP2',
+             'PNP3',
+             'PNP4',
+             'PNP5',
+             'PNP6',
+             'PNP7',
+             'PNP8',
+             'PNP9',
+             'PNP10',
+             'PNP11',
+             'PNP12',
+             'PNP13',
+             'PNP14',
+             'PNP15',
+             'PNP16',
+             'PNP17',
+             'PNP18',
+             'PNP19',
+             'PNP20',
+             'PNP21',
+             'PNP22',
+             'PNP23',
+             'PNP24',
+             'PNP25',
+             'PNP26',
+             'R1',
+             'R2',
+             'R3',
+             'R4',
+             'R5',
+             'R6',
+             'R7',
+             'R8',
+             'R9',
+             'R10',
+             'R11',
+             'R12',
+             'R13',
+             'R14',
+             'R15',
+             'R16',
+             'R17',
+             'R18',
+             'R19',
+             'R20',
+             'R21',
+             'R22',
+             'R23',
+             'R24',
+             'R25',
+             'R26',
+             'R27',
+             'C1',
+             'C2',
+             'C3',
+             'C4',
+             'C5',
+             'C6',
+             'C7',
+             'C8',
+             'C9',
+             'C10',
+             'C11',
+             'C12',
+             'C13',
+             'C14',
+             'C15',
+             'L1',
+             'L2',
+             'L3',
+             'L4',
+             'L5',
+             'L6',
+             'L7',
+             'L8',
+             'L9',
+             'L10',
+             'L11',
+             'L12',
+             'L13',
+             'L14',
+             'L15',
+             'L16',
+             'L17',
+             'L18',
+             'L19',
+             'L20',
+             'L21',
+             'L22',
+             'L23',
+             'DIO1',
+             'DIO2',
+             'DIO3',
+             'DIO4',
+             'DIO5',
+             'DIO6',
+             'DIO7',
+             'INVERTER1',
+             'INVERTER2',
+             'INVERTER3',
+             'INVERTER4',
+             'INVERTER5',
+             'INVERTER6',
+             'INVERTER7',
+             'INVERTER8',
+             'INVERTER9',
+             'INVERTER10',
+             'TRANSMISSION_GATE1',
+             'TRANSMISSION_GATE2',
+             'TRANSMISSION_GATE3',
+             'TRANSMISSION_GATE4',
+             'TRANSMISSION_GATE5',
+             'TRANSMISSION_GATE6',
+             'TRANSMISSION_GATE7',
+             'TRANSMISSION_GATE8',
+             'TRANSMISSION_GATE9',
+             'TRANSMISSION_GATE10',
+             'TRANSMISSION_GATE11',
+             'TRANSMISSION_GATE12',
+             'XOR1',
+             'PFD1'),
+ 'pins': ('NM1_D',
+          'NM1_G',
+          'NM1_S',
+          'NM1_B',
+          'NM2_D',
+          'NM2_G',
+          'NM2_S',
+          'NM2_B',
+          'NM3_D',
+          'NM3_G',
+          'NM3_S',
+          'NM3_B',
+          'NM4_D',
+          'NM4_G',
+          'NM4_S',
+          'NM4_B',
+          'NM5_D',
+          'NM5_G',
+          'NM5_S',
+          'NM5_B',
+          'NM6_D',
+          'NM6_G',
+          'NM6_S',
+          'NM6_B',
+          'NM7_D',
+          'NM7_G',
+          'NM7_S',
+          'NM7_B',
+          'NM8_D',
+          'NM8_G',
+          'NM8_S',
+          'NM8_B',
+          'NM9_D',
+          'NM9_G',
+          'NM9_S',
+          'NM9_B',
+          'NM10_D',
+          'NM10_G',
+          'NM10_S',
+          'NM10_B',
+          'NM11_D',
+          'NM11_G',
+          'NM11_S',
+          'NM11_B',
+          'NM12_D',
+          'NM12_G',
+          'NM12_S',
+          'NM12_B',
+          'NM13_D',
+          'NM13_G',
+          'NM13_S',
+          'NM13_B',
+          'NM14_D',
+          'NM14_G',
+          'NM14_S',
+          'NM14_B',
+          'NM15_D',
+          'NM15_G',
+          'NM15_S',
+          'NM15_B',
+          'NM16_D',
+          'NM16_G',
+          'NM16_S',
+          'NM16_B',
+          'NM17_D',
+          'NM17_G',
+          'NM17_S',
+          'NM17_B',
+          'NM18_D',
+          'NM18_G',
+          'NM18_S',
+          'NM18_B',
+          'NM19_D',
+          'NM19_G',
+          'NM19_S',
+          'NM19_B',
+          'NM20_D',
+          'NM20_G',
+          'NM20_S',
+          'NM20_B',
+          'NM21_D',
+          'NM21_G',
+          'NM21_S',
+          'NM21_B',
+          'NM22_D',
+          'NM22_G',
+          'NM22_S',
+          'NM22_B',
+          'NM23_D',
+          'NM23_G',
+          'NM23_S',
+          'NM23_B',
+          'NM24_D',
+          'NM24_G',
+          'NM24_S',
+          'NM24_B',
+          'NM25_D',
+          'NM25_G',
+          'NM25_S',
+          'NM25_B',
+          'NM26_D',
+          'NM26_G',
+          'NM26_S',
+          'NM26_B',
+          'NM27_D',
+          'NM27_G',
+          'NM27_S',
+          'NM27_B',
+          'NM28_D',
+          'NM28_G',
+          'NM28_S',
+          'NM28_B',
+          'NM29_D',
+          'NM29_G',
+          'NM29_S',
+          'NM29_B',
+          'NM30_D',
+          'NM30_G',
+          'NM30_S',
+          'NM30_B',
+          'NM31_D',
+          'NM31_G',
+          'NM31_S',
+          'NM31_B',
+          'NM32_D',
+          'NM32_G',
+          'NM32_S',
+          'NM32_B',
+          'NM33_D',
+          'NM33_G',
+          'NM33_S',
+          'NM33_B',
+          'NM34_D',
+          'NM34_G',
+          'NM34_S',
+          'NM34_B',
+          'PM1_D',
+          'PM1_G',
+          'PM1_S',
+          'PM1_B',
+          'PM2_D',
+          'PM2_G',
+          'PM2_S',
+          'PM2_B',
+          'PM3_D',
+          'PM3_G',
+          'PM3_S',
+          'PM3_B',
+          'PM4_D',
+          'PM4_G',
+          'PM4_S',
+          'PM4_B',
+          'PM5_D',
+          'PM5_G',
+          'PM5_S',
+          'PM5_B',
+          'PM6_D',
+          'PM6_G',
+          'PM6_S',
+          'PM6_B',
+          'PM7_D',
+          'PM7_G',
+          'PM7_S',
+          'PM7_B',
+          'PM8_D',
+          'PM8_G',
+          'PM8_S',
+          'PM8_B',
+          'PM9_D',
+          'PM9_G',
+          'PM9_S',
+          'PM9_B',
+          'PM10_D',
+          'PM10_G',
+          'PM10_S',
+          'PM10_B',
+          'PM11_D',
+          'PM11_G',
+          'PM11_S',
+          'PM11_B',
+          'PM12_D',
+          'PM12_G',
+          'PM12_S',
+          'PM12_B',
+          'PM13_D',
+          'PM13_G',
+          'PM13_S',
+          'PM13_B',
+          'PM14_D',
+          'PM14_G',
+          'PM14_S',
+          'PM14_B',
+          'PM15_D',
+          'PM15_G',
+          'PM15_S',
+          'PM15_B',
+          'PM16_D',
+          'PM16_G',
+          'PM16_S',
+          'PM16_B',
+          'PM17_D',
+          'PM17_G',
+          'PM17_S',
+          'PM17_B',
+          'PM18_D',
+          'PM18_G',
+          'PM18_S',
+          'PM18_B',
+          'PM19_D',
+          'PM19_G',
+          'PM19_S',
+          'PM19_B',
+          'PM20_D',
+          'PM20_G',
+          'PM20_S',
+          'PM20_B',
+          'PM21_D',
+          'PM21_G',
+          'PM21_S',
+          'PM21_B',
+          'PM22_D',
+          'PM22_G',
+          'PM22_S',
+          'PM22_B',
+          'PM23_D',
+          'PM23_G',
+          'PM23_S',
+          'PM23_B',
+          'PM24_D',
+          'PM24_G',
+          'PM24_S',
+          'PM24_B',
+          'PM25_D',
+          'PM25_G',
+          'PM25_S',
+          'PM25_B',
+          'PM26_D',
+          'PM26_G',
+          'PM26_S',
+          'PM26_B',
+          'PM27_D',
+          'PM27_G',
+          'PM27_S',
+          'PM27_B',
+          'PM28_D',
+          'PM28_G',
+          'PM28_S',
+          'PM28_B',
+          'PM29_D',
+          'PM29_G',
+          'PM29_S',
+          'PM29_B',
+          'PM30_D',
+          'PM30_G',
+          'PM30_S',
+          'PM30_B',
+          'PM31_D',
+          'PM31_G',
+          'PM31_S',
+          'PM31_B',
+          'PM32_D',
+          'PM32_G',
+          'PM32_S',
+          'PM32_B',
+          'PM33_D',
+          'PM33_G',
+          'PM33_S',
+          'PM33_B',
+          'PM34_D',
+          'PM34_G',
+          'PM34_S',
+          'PM34_B',
+          'NPN1_C',
+          'NPN1_B',
+          'NPN1_E',
+          'NPN2_C',
+          'NPN2_B',
+          'NPN2_E',
+          'NPN3_C',
+          'NPN3_B',
+          'NPN3_E',
+          'NPN4_C',
+          'NPN4_B',
+          'NPN4_E',
+          'NPN5_C',
+          'NPN5_B',
+          'NPN5_E',
+          'NPN6_C',
+          'NPN6_B',
+          'NPN6_E',
+          'NPN7_C',
+          'NPN7_B',
+          'NPN7_E',
+          'NPN8_C',
+          'NPN8_B',
+          'NPN8_E',
+          'NPN9_C',
+          'NPN9_B',
+          'NPN9_E',
+          'NPN10_C',
+          'NPN10_B',
+          'NPN10_E',
+          'NPN11_C',
+          'NPN11_B',
+          'NPN11_E',
+          'NPN12_C',
+          'NPN12_B',
+          'NPN12_E',
+          'NPN13_C',
+          'NPN13_B',
+          'NPN13_E',
+          'NPN14_C',
+          'NPN14_B',
+          'NPN14_E',
+          'NPN15_C',
+          'NPN15_B',
+          'NPN15_E',
+          'NPN16_C',
+          'NPN16_B',
+          'NPN16_E',
+          'NPN17_C',
+          'NPN17_B',
+          'NPN17_E',
+          'NPN18_C',
+          'NPN18_B',
+          'NPN18_E',
+          'NPN19_C',
+          'NPN19_B',
+          'NPN19_E',
+          'NPN20_C',
+          'NPN20_B',
+          'NPN20_E',
+          'NPN21_C',
+          'NPN21_B',
+          'NPN21_E',
+          'NPN22_C',
+          'NPN22_B',
+          'NPN22_E',
+          'NPN23_C',
+          'NPN23_B',
+          'NPN23_E',
+          'NPN24_C',
+          'NPN24_B',
+          'NPN24_E',
+          'NPN25_C',
+          'NPN25_B',
+          'NPN25_E',
+          'NPN26_C',
+          'NPN26_B',
+          'NPN26_E',
+          'PNP1_C',
+          'PNP1_B',
+          'PNP1_E',
+          'PNP2_C',
+          'PNP2_B',
+          'PNP2_E',
+          'PNP3_C',
+          'PNP3_B',
+          'PNP3_E',
+          'PNP4_C',
+          'PNP4_B',
+          'PNP4_E',
+          'PNP5_C',
+          'PNP5_B',
+          'PNP5_E',
+          'PNP6_C',
+          'PNP6_B',
+          'PNP6_E',
+          'PNP7_C',
+          'PNP7_B',
+          'PNP7_E',
+          'PNP8_C',
+          'PNP8_B',
+          'PNP8_E',
+          'PNP9_C',
+          'PNP9_B',
+          'PNP9_E',
+          'PNP10_C',
+          'PNP10_B',
+          'PNP10_E',
+          'PNP11_C',
+          'PNP11_B',
+          'PNP11_E',
+          'PNP12_C',
+          'PNP12_B',
+          'PNP12_E',
+          'PNP13_C',
+          'PNP13_B',
+          'PNP13_E',
+          'PNP14_C',
+          'PNP14_B',
+          'PNP14_E',
+          'PNP15_C',
+          'PNP15_B',
+          'PNP15_E',
+          'PNP16_C',
+          'PNP16_B',
+          'PNP16_E',
+          'PNP17_C',
+          'PNP17_B',
+          'PNP17_E',
+          'PNP18_C',
+          'PNP18_B',
+          'PNP18_E',
+          'PNP19_C',
+          'PNP19_B',
+          'PNP19_E',
+          'PNP20_C',
+          'PNP20_B',
+          'PNP20_E',
+          'PNP21_C',
+          'PNP21_B',
+          'PNP21_E',
+          'PNP22_C',
+          'PNP22_B',
+          'PNP22_E',
+          'PNP23_C',
+          'PNP23_B',
+          'PNP23_E',
+          'PNP24_C',
+          'PNP24_B',
+          'PNP24_E',
+          'PNP25_C',
+          'PNP25_B',
+          'PNP25_E',
+          'PNP26_C',
+          'PNP26_B',
+          'PNP26_E',
+          'R1_P',
+          'R1_N',
+          'R2_P',
+          'R2_N',
+          'R3_P',
+          'R3_N',
+          'R4_P',
+          'R4_N',
+          'R5_P',
+          'R5_N',
+          'R6_P',
+          'R6_N',
+          'R7_P',
+          'R7_N',
+          'R8_P',
+          'R8_N',
+          'R9_P',
+          'R9_N',
+          'R10_P',
+          'R10_N',
+          'R11_P',
+          'R11_N',
+          'R12_P',
+          'R12_N',
+          'R13_P',
+          'R13_N',
+          'R14_P',
+          'R14_N',
+          'R15_P',
+          'R15_N',
+          'R16_P',
+          'R16_N',
+          'R17_P',
+          'R17_N',
+          'R18_P',
+          'R18_N',
+          'R19_P',
+          'R19_N',
+          'R20_P',
+          'R20_N',
+          'R21_P',
+          'R21_N',
+          'R22_P',
+          'R22_N',
+          'R23_P',
+          'R23_N',
+          'R24_P',
+          'R24_N',
+          'R25_P',
+          'R25_N',
+          'R26_P',
+          'R26_N',
+          'R27_P',
+          'R27_N',
+          'C1_P',
+          'C1_N',
+          'C2_P',
+          'C2_N',
+          'C3_P',
+          'C3_N',
+          'C4_P',
+          'C4_N',
+          'C5_P',
+          'C5_N',
+          'C6_P',
+          'C6_N',
+          'C7_P',
+          'C7_N',
+          'C8_P',
+          'C8_N',
+          'C9_P',
+          'C9_N',
+          'C10_P',
+          'C10_N',
+          'C11_P',
+          'C11_N',
+          'C12_P',
+          'C12_N',
+          'C13_P',
+          'C13_N',
+          'C14_P',
+          'C14_N',
+          'C15_P',
+          'C15_N',
+          'L1_P',
+          'L1_N',
+          'L2_P',
+          'L2_N',
+          'L3_P',
+          'L3_N',
+          'L4_P',
+          'L4_N',
+          'L5_P',
+          'L5_N',
+          'L6_P',
+          'L6_N',
+          'L7_P',
+          'L7_N',
+          'L8_P',
+          'L8_N',
+          'L9_P',
+          'L9_N',
+          'L10_P',
+          'L10_N',
+          'L11_P',
+          'L11_N',
+          'L12_P',
+          'L12_N',
+          'L13_P',
+          'L13_N',
+          'L14_P',
+          'L14_N',
+          'L15_P',
+          'L15_N',
+          'L16_P',
+          'L16_N',
+          'L17_P',
+          'L17_N',
+          'L18_P',
+          'L18_N',
+          'L19_P',
+          'L19_N',
+          'L20_P',
+          'L20_N',
+          'L21_P',
+          'L21_N',
+          'L22_P',
+          'L22_N',
+          'L23_P',
+          'L23_N',
+          'DIO1_P',
+          'DIO1_N',
+          'DIO2_P',
+          'DIO2_N',
+          'DIO3_P',
+          'DIO3_N',
+          'DIO4_P',
+          'DIO4_N',
+          'DIO5_P',
+          'DIO5_N',
+          'DIO6_P',
+          'DIO6_N',
+          'DIO7_P',
+          'DIO7_N',
+          'INVERTER1_A',
+          'INVERTER1_Q',
+          'INVERTER1_VDD',
+          'INVERTER1_VSS',
+          'INVERTER2_A',
+          'INVERTER2_Q',
+          'INVERTER2_VDD',
+          'INVERTER2_VSS',
+          'INVERTER3_A',
+          'INVERTER3_Q',
+          'INVERTER3_VDD',
+          'INVERTER3_VSS',
+          'INVERTER4_A',
+          'INVERTER4_Q',
+          'INVERTER4_VDD',
+          'INVERTER4_VSS',
+          'INVERTER5_A',
+          'INVERTER5_Q',
+          'INVERTER5_VDD',
+          'INVERTER5_VSS',
+          'INVERTER6_A',
+          'INVERTER6_Q',
+          'INVERTER6_VDD',
+          'INVERTER6_VSS',
+          'INVERTER7_A',
+          'INVERTER7_Q',
+          'INVERTER7_VDD',
+          'INVERTER7_VSS',
+          'INVERTER8_A',
+          'INVERTER8_Q',
+          'INVERTER8_VDD',
+          'INVERTER8_VSS',
+          'INVERTER9_A',
+          'INVERTER9_Q',
+          'INVERTER9_VDD',
+          'INVERTER9_VSS',
+          'INVERTER10_A',
+          'INVERTER10_Q',
+          'INVERTER10_VDD',
+          'INVERTER10_VSS',
+          'TRANSMISSION_GATE1_A',
+          'TRANSMISSION_GATE1_B',
+          'TRANSMISSION_GATE1_C',
+          'TRANSMISSION_GATE1_VDD',
+          'TRANSMISSION_GATE1_VSS',
+          'TRANSMISSION_GATE2_A',
+          'TRANSMISSION_GATE2_B',
+          'TRANSMISSION_GATE2_C',
+          'TRANSMISSION_GATE2_VDD',
+          'TRANSMISSION_GATE2_VSS',
+          'TRANSMISSION_GATE3_A',
+          'TRANSMISSION_GATE3_B',
+          'TRANSMISSION_GATE3_C',
+          'TRANSMISSION_GATE3_VDD',
+          'TRANSMISSION_GATE3_VSS',
+          'TRANSMISSION_GATE4_A',
+          'TRANSMISSION_GATE4_B',
+          'TRANSMISSION_GATE4_C',
+          'TRANSMISSION_GATE4_VDD',
+          'TRANSMISSION_GATE4_VSS',
+          'TRANSMISSION_GATE5_A',
+          'TRANSMISSION_GATE5_B',
+          'TRANSMISSION_GATE5_C',
+          'TRANSMISSION_GATE5_VDD',
+          'TRANSMISSION_GATE5_VSS',
+          'TRANSMISSION_GATE6_A',
+          'TRANSMISSION_GATE6_B',
+          'TRANSMISSION_GATE6_C',
+          'TRANSMISSION_GATE6_VDD',
+          'TRANSMISSION_GATE6_VSS',
+          'TRANSMISSION_GATE7_A',
+          'TRANSMISSION_GATE7_B',
+          'TRANSMISSION_GATE7_C',
+          'TRANSMISSION_GATE7_VDD',
+          'TRANSMISSION_GATE7_VSS',
+          'TRANSMISSION_GATE8_A',
+          'TRANSMISSION_GATE8_B',
+          'TRANSMISSION_GATE8_C',
+          'TRANSMISSION_GATE8_VDD',
+          'TRANSMISSION_GATE8_VSS',
+          'TRANSMISSION_GATE9_A',
+          'TRANSMISSION_GATE9_B',
+          'TRANSMISSION_GATE9_C',
+          'TRANSMISSION_GATE9_VDD',
+          'TRANSMISSION_GATE9_VSS',
+          'TRANSMISSION_GATE10_A',
+          'TRANSMISSION_GATE10_B',
+          'TRANSMISSION_GATE10_C',
+          'TRANSMISSION_GATE10_VDD',
+          'TRANSMISSION_GATE10_VSS',
+          'TRANSMISSION_GATE11_A',
+          'TRANSMISSION_GATE11_B',
+          'TRANSMISSION_GATE11_C',
+          'TRANSMISSION_GATE11_VDD',
+          'TRANSMISSION_GATE11_VSS',
+          'TRANSMISSION_GATE12_A',
+          'TRANSMISSION_GATE12_B',
+          'TRANSMISSION_GATE12_C',
+          'TRANSMISSION_GATE12_VDD',
+          'TRANSMISSION_GATE12_VSS',
+          'XOR1_A',
+          'XOR1_B',
+          'XOR1_VDD',
+          'XOR1_VSS',
+          'XOR1_Y',
+          'PFD1_A',
+          'PFD1_B',
+          'PFD1_QA',
+          'PFD1_QB',
+          'PFD1_VDD',
+          'PFD1_VSS'),
+ 'externals': ('VIN1',
+               'VIN2',
+               'VIN3',
+               'VIN4',
+               'VIN5',
+               'VIN6',
+               'VIN7',
+               'VIN8',
+               'VIN9',
+               'VIN10',
+               'IIN1',
+               'IIN2',
+               'VOUT1',
+               'VOUT2',
+               'VOUT3',
+               'VOUT4',
+               'VOUT5',
+               'VOUT6',
+               'IOUT1',
+               'IOUT2',
+               'IOUT3',
+               'IOUT4',
+               'VB1',
+               'VB2',
+               'VB3',
+               'VB4',
+               'VB5',
+               'VB6',
+               'VB7',
+               'VB8',
+               'VB9',
+               'VB10',
+               'IB1',
+               'IB2',
+               'IB3',
+               'IB4',
+               'IB5',
+               'IB6',
+               'VCONT1',
+               'VCONT2',
+               'VCONT3',
+               'VCONT4',
+               'VCONT5',
+               'VCONT6',
+               'VCONT7',
+               'VCONT8',
+               'VCONT9',
+               'VCONT10',
+               'VCONT11',
+               'VCONT12',
+               'VCONT13',
+               'VCONT14',
+               'VCONT15',
+               'VCONT16',
+               'VCONT17',
+               'VCONT18',
+               'VCONT19',
+               'VCONT20',
+               'VCLK1',
+               'VCLK2',
+               'VCLK3',
+               'VCLK4',
+               'VCLK5',
+               'VCLK6',
+               'VCLK7',
+               'VCLK8',
+               'VCM1',
+               'VCM2',
+               'VREF1',
+               'VREF2',
+               'IREF1',
+               'IREF2',
+               'VRF1',
+               'VRF2',
+               'VLO1',
+               'VLO2',
+               'VLO3',
+               'VLO4',
+               'VIF1',
+               'VIF2',
+               'VBB1',
+               'VBB2',
+               'VBB3',
+               'VBB4',
+               'LOGICA1',
+               'LOGICA2',
+               'LOGICB1',
+               'LOGICB2',
+               'LOGICD1',
+               'LOGICD2',
+               'LOGICF1',
+               'LOGICF2',
+               'LOGICG1',
+               'LOGICG2',
+               'LOGICQ1',
+               'LOGICQ2',
+               'VLATCH1',
+               'VLATCH2',
+               'VTRACK1',
+               'VTRACK2'),
+ 'single_externals': ('LOGICQA1', 'LOGICQB1', 'VHOLD1'),
+ 'special': ('VDD', 'VSS', 'TRUNCATE')}
+
+BY_FAMILY = {'NM': {'devices': ('NM1',
+                    'NM2',
+                    'NM3',
+                    'NM4',
+                    'NM5',
+                    'NM6',
+                    'NM7',
+                    'NM8',
+                    'NM9',
+                    'NM10',
+                    'NM11',
+                    'NM12',
+                    'NM13',
+                    'NM14',
+                    'NM15',
+                    'NM16',
+                    'NM17',
+                    'NM18',
+                    'NM19',
+                    'NM20',
+                    'NM21',
+                    'NM22',
+                    'NM23',
+                    'NM24',
+                    'NM25',
+                    'NM26',
+                    'NM27',
+                    'NM28',
+                    'NM29',
+                    'NM30',
+                    'NM31',
+                    'NM32',
+                    'NM33',
+                    'NM34'),
+        'pins': ('NM1_D',
+                 'NM1_G',
+                 'NM1_S',
+                 'NM1_B',
+                 'NM2_D',
+                 'NM2_G',
+                 'NM2_S',
+                 'NM2_B',
+                 'NM3_D',
+                 'NM3_G',
+                 'NM3_S',
+                 'NM3_B',
+                 'NM4_D',
+                 'NM4_G',
+                 'NM4_S',
+                 'NM4_B',
+                 'NM5_D',
+                 'NM5_G',
+                 'NM5_S',
+                 'NM5_B',
+                 'NM6_D',
+                 'NM6_G',
+                 'NM6_S',
+                 'NM6_B',
+                 'NM7_D',
+                 'NM7_G',
+                 'NM7_S',
+                 'NM7_B',
+                 'NM8_D',
+                 'NM8_G',
+                 'NM8_S',
+                 'NM8_B',
+                 'NM9_D',
+                 'NM9_G',
+                 'NM9_S',
+                 'NM9_B',
+                 'NM10_D',
+                 'NM10_G',
+                 'NM10_S',
+                 'NM10_B',
+                 'NM11_D',
+                 'NM11_G',
+                 'NM11_S',
+                 'NM11_B',
+                 'NM12_D',
+                 'NM12_G',
+                 'NM12_S',
+                 'NM12_B',
+                 'NM13_D',
+                 'NM13_G',
+                 'NM13_S',
+                 'NM13_B',
+                 'NM14_D',
+                 'NM14_G',
+                 'NM14_S',
+                 'NM14_B',
+                 'NM15_D',
+                 'NM15_G',
+                 'NM15_S',
+                 'NM15_B',
+                 'NM16_D',
+                 'NM16_G',
+                 'NM16_S',
+                 'NM16_B',
+                 'NM17_D',
+                 'NM17_G',
+                 'NM17_S',
+                 'NM17_B',
+                 'NM18_D',
+                 'NM18_G',
+                 'NM18_S',
+                 'NM18_B',
+                 'NM19_D',
+                 'NM19_G',
+                 'NM19_S',
+                 'NM19_B',
+                 'NM20_D',
+                 'NM20_G',
+                 'NM20_S',
+                 'NM20_B',
+                 'NM21_D',
+                 'NM21_G',
+                 'NM21_S',
+                 'NM21_B',
+                 'NM22_D',
+                 'NM22_G',
+                 'NM22_S',
+                 'NM22_B',
+                 'NM23_D',
+                 'NM23_G',
+                 'NM23_S',
+                 'NM23_B',
+                 'NM24_D',
+                 'NM24_G',
+                 'NM24_S',
+                 'NM24_B',
+                 'NM25_D',
+                 'NM25_G',
+                 'NM25_S',
+                 'NM25_B',
+                 'NM26_D',
+                 'NM26_G',
+                 'NM26_S',
+                 'NM26_B',
+                 'NM27_D',
+                 'NM27_G',
+                 'NM27_S',
+                 'NM27_B',
+                 'NM28_D',
+                 'NM28_G',
+                 'NM28_S',
+                 'NM28_B',
+                 'NM29_D',
+                 'NM29_G',
+                 'NM29_S',
+                 'NM29_B',
+                 'NM30_D',
+                 'NM30_G',
+                 'NM30_S',
+                 'NM30_B',
+                 'NM31_D',
+                 'NM31_G',
+                 'NM31_S',
+                 'NM31_B',
+                 'NM32_D',
+                 'NM32_G',
+                 'NM32_S',
+                 'NM32_B',
+                 'NM33_D',
+                 'NM33_G',
+                 'NM33_S',
+                 'NM33_B',
+                 'NM34_D',
+                 'NM34_G',
+                 'NM34_S',
+                 'NM34_B')},
+ 'PM': {'devices': ('PM1',
+                    'PM2',
+                    'PM3',
+                    'PM4',
+                    'PM5',
+                    'PM6',
+                    'PM7',
+                    'PM8',
+                    'PM9',
+                    'PM10',
+                    'PM11',
+                    'PM12',
+                    'PM13',
+                    'PM14',
+                    'PM15',
+                    'PM16',
+                    'PM17',
+                    'PM18',
+                    'PM19',
+                    'PM20',
+                    'PM21',
+                    'PM22',
+                    'PM23',
+                    'PM24',
+                    'PM25',
+                    'PM26',
+                    'PM27',
+                    'PM28',
+                    'PM29',
+                    'PM30',
+                    'PM31',
+                    'PM32',
+                    'PM33',
+                    'PM34'),
+        'pins': ('PM1_D',
+                 'PM1_G',
+                 'PM1_S',
+                 'PM1_B',
+                 'PM2_D',
+                 'PM2_G',
+                 'PM2_S',
+                 'PM2_B',
+                 'PM3_D',
+                 'PM3_G',
+                 'PM3_S',
+                 'PM3_B',
+                 'PM4_D',
+                 'PM4_G',
+                 'PM4_S',
+                 'PM4_B',
+                 'PM5_D',
+                 'PM5_G',
+                 'PM5_S',
+                 'PM5_B',
+                 'PM6_D',
+                 'PM6_G',
+                 'PM6_S',
+                 'PM6_B',
+                 'PM7_D',
+                 'PM7_G',
+                 'PM7_S',
+                 'PM7_B',
+                 'PM8_D',
+                 'PM8_G',
+                 'PM8_S',
+                 'PM8_B',
+                 'PM9_D',
+                 'PM9_G',
+                 'PM9_S',
+                 'PM9_B',
+                 'PM10_D',
+                 'PM10_G',
+                 'PM10_S',
+                 'PM10_B',
+                 'PM11_D',
+                 'PM11_G',
+                 'PM11_S',
+                 'PM11_B',
+                 'PM12_D',
+                 'PM12_G',
+                 'PM12_S',
+                 'PM12_B',
+                 'PM13_D',
+                 'PM13_G',
+                 'PM13_S',
+                 'PM13_B',
+                 'PM14_D',
+                 'PM14_G',
+                 'PM14_S',
+                 'PM14_B',
+                 'PM15_D',
+                 'PM15_G',
+                 'PM15_S',
+                 'PM15_B',
+                 'PM16_D',
+                 'PM16_G',
+                 'PM16_S',
+                 'PM16_B',
+                 'PM17_D',
+                 'PM17_G',
+                 'PM17_S',
+                 'PM17_B',
+                 'PM18_D',
+                 'PM18_G',
+                 'PM18_S',
+                 'PM18_B',
+                 'PM19_D',
+                 'PM19_G',
+                 'PM19_S',
+                 'PM19_B',
+                 'PM20_D',
+                 'PM20_G',
+                 'PM20_S',
+                 'PM20_B',
+                 'PM21_D',
+                 'PM21_G',
+                 'PM21_S',
+                 'PM21_B',
+                 'PM22_D',
+                 'PM22_G',
+                 'PM22_S',
+                 'PM22_B',
+                 'PM23_D',
+                 'PM23_G',
+                 'PM23_S',
+                 'PM23_B',
+                 'PM24_D',
+                 'PM24_G',
+                 'PM24_S',
+                 'PM24_B',
+                 'PM25_D',
+                 'PM25_G',
+                 'PM25_S',
+                 'PM25_B',
+                 'PM26_D',
+                 'PM26_G',
+                 'PM26_S',
+                 'PM26_B',
+                 'PM27_D',
+                 'PM27_G',
+                 'PM27_S',
+                 'PM27_B',
+                 'PM28_D',
+                 'PM28_G',
+                 'PM28_S',
+                 'PM28_B',
+                 'PM29_D',
+                 'PM29_G',
+                 'PM29_S',
+                 'PM29_B',
+                 'PM30_D',
+                 'PM30_G',
+                 'PM30_S',
+                 'PM30_B',
+                 'PM31_D',
+                 'PM31_G',
+                 'PM31_S',
+                 'PM31_B',
+                 'PM32_D',
+                 'PM32_G',
+                 'PM32_S',
+                 'PM32_B',
+                 'PM33_D',
+                 'PM33_G',
+                 'PM33_S',
+                 'PM33_B',
+                 'PM34_D',
+                 'PM34_G',
+                 'PM34_S',
+                 'PM34_B')},
+ 'NPN': {'devices': ('NPN1',
+                     'NPN2',
+                     'NPN3',
+                     'NPN4',
+                     'NPN5',
+                     'NPN6',
+                     'NPN7',
+                     'NPN8',
+                     'NPN9',
+                     'NPN10',
+                     'NPN11',
+                     'NPN12',
+                     'NPN13',
+                     'NPN14',
+                     'NPN15',
+                     'NPN16',
+                     'NPN17',
+                     'NPN18',
+                     'NPN19',
+                     'NPN20',
+                     'NPN21',
+                     'NPN22',
+                     'NPN23',
+                     'NPN24',
+                     'NPN25',
+                     'NPN26'),
+         'pins': ('NPN1_C',
+                  'NPN1_B',
+                  'NPN1_E',
+                  'NPN2_C',
+                  'NPN2_B',
+                  'NPN2_E',
+                  'NPN3_C',
+                  'NPN3_B',
+                  'NPN3_E',
+                  'NPN4_C',
+                  'NPN4_B',
+                  'NPN4_E',
+                  'NPN5_C',
+                  'NPN5_B',
+                  'NPN5_E',
+                  'NPN6_C',
+                  'NPN6_B',
+                  'NPN6_E',
+                  'NPN7_C',
+                  'NPN7_B',
+                  'NPN7_E',
+                  'NPN8_C',
+                  'NPN8_B',
+                  'NPN8_E',
+                  'NPN9_C',
+                  'NPN9_B',
+                  'NPN9_E',
+                  'NPN10_C',
+                  'NPN10_B',
+                  'NPN10_E',
+                  'NPN11_C',
+                  'NPN11_B',
+                  'NPN11_E',
+                  'NPN12_C',
+                  'NPN12_B',
+                  'NPN12_E',
+                  'NPN13_C',
+                  'NPN13_B',
+                  'NPN13_E',
+                  'NPN14_C',
+                  'NPN14_B',
+                  'NPN14_E',
+                  'NPN15_C',
+                  'NPN15_B',
+                  'NPN15_E',
+                  'NPN16_C',
+                  'NPN16_B',
+                  'NPN16_E',
+                  'NPN17_C',
+                  'NPN17_B',
+                  'NPN17_E',
+                  'NPN18_C',
+                  'NPN18_B',
+                  'NPN18_E',
+                  'NPN19_C',
+                  'NPN19_B',
+                  'NPN19_E',
+                  'NPN20_C',
+                  'NPN20_B',
+                  'NPN20_E',
+                  'NPN21_C',
+                  'NPN21_B',
+                  'NPN21_E',
+                  'NPN22_C',
+                  'NPN22_B',
+                  'NPN22_E',
+                  'NPN23_C',
+                  'NPN23_B',
+                  'NPN23_E',
+                  'NPN24_C',
+                  'NPN24_B',
+                  'NPN24_E',
+                  'NPN25_C',
+                  'NPN25_B',
+                  'NPN25_E',
+                  'NPN26_C',
+                  'NPN26_B',
+                  'NPN26_E')},
+ 'PNP': {'devices': ('PNP1',
+                     'PNP2',
+                     'PNP3',
+                     'PNP4',
+                     'PNP5',
+                     'PNP6',
+                     'PNP7',
+                     'PNP8',
+                     'PNP9',
+                     'PNP10',
+                     'PNP11',
+                     'PNP12',
+                     'PNP13',
+                     'PNP14',
+                     'PNP15',
+                     'PNP16',
+                     'PNP17',
+                     'PNP18',
+                     'PNP19',
+                     'PNP20',
+                     'PNP21',
+                     'PNP22',
+                     'PNP23',
+                     'PNP24',
+                     'PNP25',
+                     'PNP26'),
+         'pins': ('PNP1_C',
+                  'PNP1_B',
+                  'PNP1_E',
+                  'PNP2_C',
+                  'PNP2_B',
+                  'PNP2_E',
+                  'PNP3_C',
+                  'PNP3_B',
+                  'PNP3_E',
+                  'PNP4_C',
+                  'PNP4_B',
+                  'PNP4_E',
+                  'PNP5_C',
+                  'PNP5_B',
+                  'PNP5_E',
+                  'PNP6_C',
+                  'PNP6_B',
+                  'PNP6_E',
+                  'PNP7_C',
+                  'PNP7_B',
+                  'PNP7_E',
+                  'PNP8_C',
+                  'PNP8_B',
+                  'PNP8_E',
+                  'PNP9_C',
+                  'PNP9_B',
+                  'PNP9_E',
+                  'PNP10_C',
+                  'PNP10_B',
+                  'PNP10_E',
+                  'PNP11_C',
+                  'PNP11_B',
+                  'PNP11_E',
+                  'PNP12_C',
+                  'PNP12_B',
+                  'PNP12_E',
+                  'PNP13_C',
+                  'PNP13_B',
+                  'PNP13_E',
+                  'PNP14_C',
+                  'PNP14_B',
+                  'PNP14_E',
+                  'PNP15_C',
+                  'PNP15_B',
+                  'PNP15_E',
+                  'PNP16_C',
+                  'PNP16_B',
+                  'PNP16_E',
+                  'PNP17_C',
+                  'PNP17_B',
+                  'PNP17_E',
+                  'PNP18_C',
+                  'PNP18_B',
+                  'PNP18_E',
+                  'PNP19_C',
+                  'PNP19_B',
+                  'PNP19_E',
+                  'PNP20_C',
+                  'PNP20_B',
+                  'PNP20_E',
+                  'PNP21_C',
+                  'PNP21_B',
+                  'PNP21_E',
+                  'PNP22_C',
+                  'PNP22_B',
+                  'PNP22_E',
+                  'PNP23_C',
+                  'PNP23_B',
+                  'PNP23_E',
+                  'PNP24_C',
+                  'PNP24_B',
+                  'PNP24_E',
+                  'PNP25_C',
+                  'PNP25_B',
+                  'PNP25_E',
+                  'PNP26_C',
+                  'PNP26_B',
+                  'PNP26_E')},
+ 'R': {'devices': ('R1',
+                   'R2',
+                   'R3',
+                   'R4',
+                   'R5',
+                   'R6',
+                   'R7',
+                   'R8',
+                   'R9',
+                   'R10',
+                   'R11',
+                   'R12',
+                   'R13',
+                   'R14',
+                   'R15',
+                   'R16',
+                   'R17',
+                   'R18',
+                   'R19',
+                   'R20',
+                   'R21',
+                   'R22',
+                   'R23',
+                   'R24',
+                   'R25',
+                   'R26',
+                   'R27'),
+       'pins': ('R1_P',
+                'R1_N',
+                'R2_P',
+                'R2_N',
+                'R3_P',
+                'R3_N',
+                'R4_P',
+                'R4_N',
+                'R5_P',
+                'R5_N',
+                'R6_P',
+                'R6_N',
+                'R7_P',
+                'R7_N',
+                'R8_P',
+                'R8_N',
+                'R9_P',
+                'R9_N',
+                'R10_P',
+                'R10_N',
+                'R11_P',
+                'R11_N',
+                'R12_P',
+                'R12_N',
+                'R13_P',
+                'R13_N',
+                'R14_P',
+                'R14_N',
+                'R15_P',
+                'R15_N',
+                'R16_P',
+                'R16_N',
+                'R17_P',
+                'R17_N',
+                'R18_P',
+                'R18_N',
+                'R19_P',
+                'R19_N',
+                'R20_P',
+                'R20_N',
+                'R21_P',
+                'R21_N',
+                'R22_P',
+                'R22_N',
+                'R23_P',
+                'R23_N',
+                'R24_P',
+                'R24_N',
+                'R25_P',
+                'R25_N',
+                'R26_P',
+                'R26_N',
+                'R27_P',
+                'R27_N')},
+ 'C': {'devices': ('C1',
+                   'C2',
+                   'C3',
+                   'C4',
+                   'C5',
+                   'C6',
+                   'C7',
+                   'C8',
+                   'C9',
+                   'C10',
+                   'C11',
+                   'C12',
+                   'C13',
+                   'C14',
+                   'C15'),
+       'pins': ('C1_P',
+                'C1_N',
+                'C2_P',
+                'C2_N',
+                'C3_P',
+                'C3_N',
+                'C4_P',
+                'C4_N',
+                'C5_P',
+                'C5_N',
+                'C6_P',
+                'C6_N',
+                'C7_P',
+                'C7_N',
+                'C8_P',
+                'C8_N',
+                'C9_P',
+                'C9_N',
+                'C10_P',
+                'C10_N',
+                'C11_P',
+                'C11_N',
+                'C12_P',
+                'C12_N',
+                'C13_P',
+                'C13_N',
+                'C14_P',
+                'C14_N',
+                'C15_P',
+                'C15_N')},
+ 'L': {'devices': ('L1',
+                   'L2',
+                   'L3',
+                   'L4',
+                   'L5',
+                   'L6',
+                   'L7',
+                   'L8',
+                   'L9',
+                   'L10',
+                   'L11',
+                   'L12',
+                   'L13',
+                   'L14',
+                   'L15',
+                   'L16',
+                   'L17',
+                   'L18',
+                   'L19',
+                   'L20',
+                   'L21',
+                   'L22',
+                   'L23'),
+       'pins': ('L1_P',
+                'L1_N',
+                'L2_P',
+                'L2_N',
+                'L3_P',
+                'L3_N',
+                'L4_P',
+                'L4_N',
+                'L5_P',
+                'L5_N',
+                'L6_P',
+                'L6_N',
+                'L7_P',
+                'L7_N',
+                'L8_P',
+                'L8_N',
+                'L9_P',
+                'L9_N',
+                'L10_P',
+                'L10_N',
+                'L11_P',
+                'L11_N',
+                'L12_P',
+                'L12_N',
+                'L13_P',
+                'L13_N',
+                'L14_P',
+                'L14_N',
+                'L15_P',
+                'L15_N',
+                'L16_P',
+                'L16_N',
+                'L17_P',
+                'L17_N',
+                'L18_P',
+                'L18_N',
+                'L19_P',
+                'L19_N',
+                'L20_P',
+                'L20_N',
+                'L21_P',
+                'L21_N',
+                'L22_P',
+                'L22_N',
+                'L23_P',
+                'L23_N')},
+ 'DIO': {'devices': ('DIO1', 'DIO2', 'DIO3', 'DIO4', 'DIO5', 'DIO6', 'DIO7'),
+         'pins': ('DIO1_P',
+                  'DIO1_N',
+                  'DIO2_P',
+                  'DIO2_N',
+                  'DIO3_P',
+                  'DIO3_N',
+                  'DIO4_P',
+                  'DIO4_N',
+                  'DIO5_P',
+                  'DIO5_N',
+                  'DIO6_P',
+                  'DIO6_N',
+                  'DIO7_P',
+                  'DIO7_N')},
+ 'INVERTER': {'devices': ('INVERTER1',
+                          'INVERTER2',
+                          'INVERTER3',
+                          'INVERTER4',
+                          'INVERTER5',
+                          'INVERTER6',
+                          'INVERTER7',
+                          'INVERTER8',
+                          'INVERTER9',
+                          'INVERTER10'),
+              'pins': ('INVERTER1_A',
+                       'INVERTER1_Q',
+                       'INVERTER1_VDD',
+                       'INVERTER1_VSS',
+                       'INVERTER2_A',
+                       'INVERTER2_Q',
+                       'INVERTER2_VDD',
+                       'INVERTER2_VSS',
+                       'INVERTER3_A',
+                       'INVERTER3_Q',
+                       'INVERTER3_VDD',
+                       'INVERTER3_VSS',
+                       'INVERTER4_A',
+                       'INVERTER4_Q',
+                       'INVERTER4_VDD',
+                       'INVERTER4_VSS',
+                       'INVERTER5_A',
+                       'INVERTER5_Q',
+                       'INVERTER5_VDD',
+                       'INVERTER5_VSS',
+                       'INVERTER6_A',
+                       'INVERTER6_Q',
+                       'INVERTER6_VDD',
+                       'INVERTER6_VSS',
+                       'INVERTER7_A',
+                       'INVERTER7_Q',
+                       'INVERTER7_VDD',
+                       'INVERTER7_VSS',
+                       'INVERTER8_A',
+                       'INVERTER8_Q',
+                       'INVERTER8_VDD',
+                       'INVERTER8_VSS',
+                       'INVERTER9_A',
+                       'INVERTER9_Q',
+                       'INVERTER9_VDD',
+                       'INVERTER9_VSS',
+                       'INVERTER10_A',
+                       'INVERTER10_Q',
+                       'INVERTER10_VDD',
+                       'INVERTER10_VSS')},
+ 'TRANSMISSION_GATE': {'devices': ('TRANSMISSION_GATE1',
+                                   'TRANSMISSION_GATE2',
+                                   'TRANSMISSION_GATE3',
+                                   'TRANSMISSION_GATE4',
+                                   'TRANSMISSION_GATE5',
+                                   'TRANSMISSION_GATE6',
+                                   'TRANSMISSION_GATE7',
+                                   'TRANSMISSION_GATE8',
+                                   'TRANSMISSION_GATE9',
+                                   'TRANSMISSION_GATE10',
+                                   'TRANSMISSION_GATE11',
+                                   'TRANSMISSION_GATE12'),
+                       'pins': ('TRANSMISSION_GATE1_A',
+                                'TRANSMISSION_GATE1_B',
+                                'TRANSMISSION_GATE1_C',
+                                'TRANSMISSION_GATE1_VDD',
+                                'TRANSMISSION_GATE1_VSS',
+                                'TRANSMISSION_GATE2_A',
+                                'TRANSMISSION_GATE2_B',
+                                'TRANSMISSION_GATE2_C',
+                                'TRANSMISSION_GATE2_VDD',
+                                'TRANSMISSION_GATE2_VSS',
+                                'TRANSMISSION_GATE3_A',
+                                'TRANSMISSION_GATE3_B',
+                                'TRANSMISSION_GATE3_C',
+                                'TRANSMISSION_GATE3_VDD',
+                                'TRANSMISSION_GATE3_VSS',
+                                'TRANSMISSION_GATE4_A',
+                                'TRANSMISSION_GATE4_B',
+                                'TRANSMISSION_GATE4_C',
+                                'TRANSMISSION_GATE4_VDD',
+                                'TRANSMISSION_GATE4_VSS',
+                                'TRANSMISSION_GATE5_A',
+                                'TRANSMISSION_GATE5_B',
+                                'TRANSMISSION_GATE5_C',
+                                'TRANSMISSION_GATE5_VDD',
+                                'TRANSMISSION_GATE5_VSS',
+                                'TRANSMISSION_GATE6_A',
+                                'TRANSMISSION_GATE6_B',
+                                'TRANSMISSION_GATE6_C',
+                                'TRANSMISSION_GATE6_VDD',
+                                'TRANSMISSION_GATE6_VSS',
+                                'TRANSMISSION_GATE7_A',
+                                'TRANSMISSION_GATE7_B',
+                                'TRANSMISSION_GATE7_C',
+                                'TRANSMISSION_GATE7_VDD',
+                                'TRANSMISSION_GATE7_VSS',
+                                'TRANSMISSION_GATE8_A',
+                                'TRANSMISSION_GATE8_B',
+                                'TRANSMISSION_GATE8_C',
+                                'TRANSMISSION_GATE8_VDD',
+                                'TRANSMISSION_GATE8_VSS',
+                                'TRANSMISSION_GATE9_A',
+                                'TRANSMISSION_GATE9_B',
+                                'TRANSMISSION_GATE9_C',
+                                'TRANSMISSION_GATE9_VDD',
+                                'TRANSMISSION_GATE9_VSS',
+                                'TRANSMISSION_GATE10_A',
+                                'TRANSMISSION_GATE10_B',
+                                'TRANSMISSION_GATE10_C',
+                                'TRANSMISSION_GATE10_VDD',
+                                'TRANSMISSION_GATE10_VSS',
+                                'TRANSMISSION_GATE11_A',
+                                'TRANSMISSION_GATE11_B',
+                                'TRANSMISSION_GATE11_C',
+                                'TRANSMISSION_GATE11_VDD',
+                                'TRANSMISSION_GATE11_VSS',
+                                'TRANSMISSION_GATE12_A',
+                                'TRANSMISSION_GATE12_B',
+                                'TRANSMISSION_GATE12_C',
+                                'TRANSMISSION_GATE12_VDD',
+                                'TRANSMISSION_GATE12_VSS')},
+ 'XOR1': {'devices': ('XOR1',), 'pins': ('XOR1_A', 'XOR1_B', 'XOR1_VDD', 'XOR1_VSS', 'XOR1_Y')},
+ 'PFD1': {'devices': ('PFD1',),
+          'pins': ('PFD1_A', 'PFD1_B', 'PFD1_QA', 'PFD1_QB', 'PFD1_VDD', 'PFD1_VSS')}}
@@ -2,227 +2,759 @@
 Core search:
 - EulerState: bidirectional unused-edge tracking, adjacency that grows as we add edges,
   and a simple move system: either traverse an unused existing edge, or attach a new pin
-  via an ADD edge from the current pin.
-- MCTS with PUCT.
+  via an ADD edge from the current pin. Pins are interned to STOI ids and actions are
+  packed ints (vocab.encode_action/decode_action convert to and from token strings).
+- MCTS with PUCT over a structure-of-arrays tree (TreeArrays); run_parallel adds root
+  parallelism over independent trees in worker processes.
 - reward() calls netlist_io.score_circuit(seq_edges) to confirm "interesting" circuits
   with PySpice when available.
 """
 
 from __future__ import annotations
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
 from dataclasses import dataclass, field
 import math
 import random
-from .vocab import STOI, ITOS, TOKENS, VOCAB_SIZE, initial_adjacency, add_edge, all_candidate_new_pins
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from ._kernels import HAVE_KERNELS, backup_path, select_child_ucb, select_child_wu
+from .vocab import (STOI, TOKENS, ROOT, ACT_END, ACT_MOVE, ACT_ADD, initial_adjacency, add_new_edge,
+                    all_candidate_new_pins)
+from .netlist_io import score_circuit
 
-Edge = Tuple[str, str]  # undirected conceptual edge (ordered as (min,max) for hashing)
+Edge = int  # undirected edge packed as (min_id << 16) | max_id over STOI ids (uint32 range)
 
-def _norm_edge(a: str, b: str) -> Edge:
-    return (a, b) if a <= b else (b, a)
+StateKey = int  # 64-bit Zobrist hash of (current_pin, exists_mask, visited_mask); see same_position()
 
-@dataclass
+RewardKey = Tuple[int, int, int, int, int]  # exact (current_pin, start_pin, exists_mask, visited_mask, num_adds)
+
+def _edge_key(a: int, b: int) -> Edge:
+    return (a << 16) | b if a <= b else (b << 16) | a
+
+# pin id -> its device root for device pins ('NM1_G' -> 'NM1'), None for supplies/END
+_DEVICE_ROOT: List[Optional[str]] = [ROOT[t] if "_" in t else None for t in TOKENS]
+
+def _pin_id(pin) -> int:
+    return STOI[pin] if isinstance(pin, str) else pin
+
+_M64 = (1 << 64) - 1
+
+def _mix64(x: int) -> int:
+    """splitmix64 finalizer: deterministic, well-spread 64-bit Zobrist values without an RNG table."""
+    x = (x + 0x9E3779B97F4A7C15) & _M64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _M64
+    return x ^ (x >> 31)
+
+# Zobrist values: one per pin for "current pin", and per edge one for "exists" and one for "visited"
+_PIN_Z: List[int] = [_mix64(1 << 40 | i) for i in range(len(TOKENS))]
+
+# Process-wide dense bit allocator over packed edges. Every state shares it, so an edge has
+# the same bit in every mask and (exists_mask, visited_mask) identifies the graph canonically.
+_EDGE_BITS: Dict[Edge, int] = {}
+_EDGES: List[Edge] = []
+_EDGE_Z: List[Tuple[int, int]] = []  # dense edge index -> (exists, visited) Zobrist values
+# Searches and states on different threads share the allocator; without the lock two of them
+# could race on the same new edge and give it two bits. Hits never take it (double-checked).
+_EDGE_LOCK = threading.Lock()
+
+def _edge_bit(e: Edge) -> int:
+    i = _EDGE_BITS.get(e)
+    if i is None:
+        with _EDGE_LOCK:
+            i = _EDGE_BITS.get(e)
+            if i is None:
+                _EDGE_Z.append((_mix64(e << 1), _mix64(e << 1 | 1)))
+                _EDGES.append(e)
+                # publish the index last, so an unlocked hit always sees its _EDGES/_EDGE_Z entries
+                i = _EDGE_BITS[e] = len(_EDGES) - 1
+    return 1 << i
+
+def _mask_edges(mask: int) -> Set[Edge]:
+    out = set()
+    while mask:
+        low = mask & -mask
+        out.add(_EDGES[low.bit_length() - 1])
+        mask ^= low
+    return out
+
+@dataclass(slots=True)
 class EulerState:
-    current_pin: str
-    start_pin: str = "VSS"
-    adjacency: Dict[str, List[str]] = field(default_factory=initial_adjacency)
-    visited_edges: Set[Edge] = field(default_factory=set)
-    used_device_roots: Set[str] = field(default_factory=set)
-    seq: List[str] = field(default_factory=list)  # action history (pins or "ADD:<pin>" or "END")
-
-    def legal_actions(self) -> List[str]:
-        """Legal actions: move along an unused edge; or 'ADD:<pin>' to attach a new pin; or 'END'."""
-        actions: List[str] = []
+    # Pin fields hold STOI ids; a fresh state also accepts token names and interns them.
+    current_pin: int
+    start_pin: int = STOI["VSS"]
+    adjacency: Dict[int, Tuple[int, ...]] = field(default_factory=initial_adjacency)
+    visited_mask: int = 0  # bit set <=> that edge (see _edge_bit) has been traversed
+    exists_mask: int = 0  # bit set <=> that edge is in adjacency; derived for fresh states
+    used_device_roots: FrozenSet[str] = frozenset()  # replaced (never mutated) so copies share it
+    # packed action history as (prefix, last_action) cells; copies share the prefix
+    trail: Optional[Tuple] = None
+    # pin -> {not-yet-visited neighbor: that edge's bit in visited_mask}, in adjacency order (O(1) removal).
+    # Caching the bit here means moves never go back through _edge_key/_edge_bit.
+    # The inner dicts are replaced, never mutated, so copies only duplicate the outer dict.
+    unused_nb: Optional[Dict[int, Dict[int, int]]] = None
+    # ADD actions for the current used_device_roots; reset whenever that set changes
+    add_actions: Optional[Tuple[int, ...]] = None
+    zhash: int = 0  # Zobrist hash updated per action; derived for fresh states
+    num_adds: int = 0  # ADD actions in the trail (score_circuit penalizes them); derived for fresh states
+
+    def __post_init__(self) -> None:
+        if self.unused_nb is None:
+            # Fresh state (not a copy): intern pins and freeze neighbor lists so copies can share them
+            self.current_pin = _pin_id(self.current_pin)
+            self.start_pin = _pin_id(self.start_pin)
+            self.adjacency = {_pin_id(a): tuple(_pin_id(b) for b in nbs) for a, nbs in self.adjacency.items()}
+            self.used_device_roots = frozenset(self.used_device_roots)
+            m = self.visited_mask
+            self.exists_mask = 0
+            self.unused_nb = {}
+            for a, nbs in self.adjacency.items():
+                bits = [(b, _edge_bit(_edge_key(a, b))) for b in nbs]
+                for _, bit in bits:
+                    self.exists_mask |= bit
+                self.unused_nb[a] = {b: bit for b, bit in bits if not m & bit}
+            z = _PIN_Z[self.current_pin]
+            for i, e in enumerate(_EDGES):
+                if self.exists_mask >> i & 1:
+                    z ^= _EDGE_Z[i][0]
+                if m >> i & 1:
+                    z ^= _EDGE_Z[i][1]
+            self.zhash = z
+            self.num_adds = sum(1 for a in self.seq if a & 3 == ACT_ADD)
+
+    @property
+    def seq(self) -> List[int]:
+        """Action history, materialized from the trail (O(len); meant for export/scoring)."""
+        out: List[int] = []
+        t = self.trail
+        while t is not None:
+            t, a = t
+            out.append(a)
+        out.reverse()
+        return out
+
+    @property
+    def visited_edges(self) -> Set[Edge]:
+        """Packed keys of the traversed edges, decoded from visited_mask (O(E); hot paths use the mask)."""
+        return _mask_edges(self.visited_mask)
+
+    def num_visited(self) -> int:
+        return self.visited_mask.bit_count()
+
+    def legal_actions(self) -> List[int]:
+        """Legal packed actions: MOVE along an unused edge; or ADD to attach a new pin; or END."""
         # Move along unused existing edges
-        for nb in self.adjacency.get(self.current_pin, []):
-            e = _norm_edge(self.current_pin, nb)
-            if e not in self.visited_edges:
-                actions.append(nb)
+        actions: List[int] = [ACT_MOVE | nb << 2 for nb in self.unused_nb.get(self.current_pin, ())]
 
         # If not complete, allow adding a new pin (connects via a new edge)
         if not self.is_complete():
-            for pin in all_candidate_new_pins(self.used_device_roots):
-                actions.append(f"ADD:{pin}")
+            adds = self.add_actions
+            if adds is None:
+                adds = tuple(ACT_ADD | STOI[pin] << 2 for pin in all_candidate_new_pins(self.used_device_roots))
+                self.add_actions = adds
+            actions.extend(adds)
 
         # End condition
         if self.is_complete() and self.current_pin == self.start_pin:
-            actions.append("END")
+            actions.append(ACT_END)
         return actions
 
-    def apply(self, action: str) -> "EulerState":
+    def apply(self, action: int) -> "EulerState":
         ns = self.copy()
-        if action == "END":
-            ns.seq.append("END")
-            return ns
-
-        if action.startswith("ADD:"):
-            pin = action.split("ADD:", 1)[1]
-            add_edge(ns.adjacency, self.current_pin, pin)
-            ns.seq.append(action)
+        ns.apply_inplace(action)
+        return ns
+
+    def apply_inplace(self, action: int) -> Tuple:
+        """Mutate this state by packed `action`; returns an undo record for undo()."""
+        self.trail = (self.trail, action)
+        kind = action & 3
+        if kind == ACT_END:
+            return ("END",)
+
+        cur = self.current_pin
+        if kind == ACT_ADD:
+            self.num_adds += 1
+            pin = action >> 2
+            bit = _edge_bit(_edge_key(cur, pin))
+            old_adj = self.adjacency
+            old_nbs = None
+            old_z = self.zhash
+            if not self.exists_mask & bit:
+                # New edge (exists_mask is the membership test): copy-on-write the adjacency
+                # dict and the two endpoint entries
+                adj = dict(old_adj)
+                add_new_edge(adj, cur, pin)
+                self.adjacency = adj
+                self.exists_mask |= bit
+                self.zhash = old_z ^ _EDGE_Z[bit.bit_length() - 1][0]
+                nb = self.unused_nb
+                old_nbs = (nb.get(cur), nb.get(pin))
+                nb[cur] = {**(nb.get(cur) or {}), pin: bit}
+                if pin != cur:
+                    nb[pin] = {**(nb.get(pin) or {}), cur: bit}
             # mark device as used
-            from .vocab import device_root
-            root = device_root(pin)
-            if "_" in pin:
-                ns.used_device_roots.add(root)
-            return ns
+            root = _DEVICE_ROOT[pin]
+            old_roots = self.used_device_roots
+            if root is not None and root not in old_roots:
+                self.used_device_roots = old_roots | {root}
+                self.add_actions = None
+            return ("ADD", pin, bit if old_nbs else 0, old_adj, old_nbs, old_roots, old_z)
 
         # otherwise action is moving to an existing neighbor
-        nb = action
-        e = _norm_edge(self.current_pin, nb)
-        ns.visited_edges.add(e)
-        ns.seq.append(nb)
-        ns.current_pin = nb
+        nb = action >> 2
+        old_cur, old_nb = self.unused_nb[cur], self.unused_nb[nb]
+        bit = old_cur.get(nb)
+        if bit is None:  # already-visited edge: not cached, look it up
+            bit = _edge_bit(_edge_key(cur, nb))
+        old_mask = self.visited_mask
+        self.visited_mask = old_mask | bit
+        old_z = self.zhash
+        z = old_z ^ _PIN_Z[cur] ^ _PIN_Z[nb]
+        if not old_mask & bit:
+            z ^= _EDGE_Z[bit.bit_length() - 1][1]
+        self.zhash = z
+        # Replace (not mutate) the two endpoint sets so undo restores their exact order
+        self.unused_nb[cur] = {k: v for k, v in old_cur.items() if k != nb}
+        if nb != cur:
+            self.unused_nb[nb] = {k: v for k, v in old_nb.items() if k != cur}
+        self.current_pin = nb
         # Track device usage if we land on a device pin
-        from .vocab import device_root
-        root = device_root(nb)
-        if "_" in nb:
-            ns.used_device_roots.add(root)
-        return ns
+        root = _DEVICE_ROOT[nb]
+        old_roots = self.used_device_roots
+        if root is not None and root not in old_roots:
+            self.used_device_roots = old_roots | {root}
+            self.add_actions = None
+        return ("MOVE", cur, old_mask, old_cur, old_nb, old_roots, old_z)
+
+    def undo(self, record: Tuple) -> None:
+        """Revert the apply_inplace() call that returned `record` (records must be undone LIFO)."""
+        self.trail = self.trail[0]
+        kind = record[0]
+        if kind == "END":
+            return
+        if kind == "ADD":
+            _, pin, new_bit, old_adj, old_nbs, old_roots, self.zhash = record
+            self.num_adds -= 1
+            self.adjacency = old_adj
+            if new_bit:
+                self.exists_mask ^= new_bit
+                cur = self.current_pin
+                # a self-loop (pin == cur) touched a single entry, so restore each key once
+                for k, d in {pin: old_nbs[1], cur: old_nbs[0]}.items():
+                    if d is None:
+                        del self.unused_nb[k]
+                    else:
+                        self.unused_nb[k] = d
+        else:
+            _, cur, old_mask, old_cur, old_nb, old_roots, self.zhash = record
+            self.visited_mask = old_mask
+            self.unused_nb[self.current_pin] = old_nb
+            self.unused_nb[cur] = old_cur
+            self.current_pin = cur
+        if old_roots is not self.used_device_roots:
+            self.used_device_roots = old_roots
+            self.add_actions = None
 
     def is_complete(self) -> bool:
-        # All edges in adjacency must be visited (undirected count)
-        total_edges = 0
-        for a, nbs in self.adjacency.items():
-            total_edges += len(nbs)
-        total_edges //= 2
-        return len(self.visited_edges) >= total_edges and total_edges > 0
+        # All edges in adjacency must be visited: one int compare
+        return self.exists_mask != 0 and self.visited_mask == self.exists_mask
 
     def copy(self) -> "EulerState":
+        # Everything but the outer unused_nb dict is immutable by convention, hence shared
         return EulerState(
             current_pin=self.current_pin,
             start_pin=self.start_pin,
-            adjacency={k: list(v) for k, v in self.adjacency.items()},
-            visited_edges=set(self.visited_edges),
-            used_device_roots=set(self.used_device_roots),
-            seq=list(self.seq),
+            adjacency=self.adjacency,
+            visited_mask=self.visited_mask,
+            exists_mask=self.exists_mask,
+            unused_nb=dict(self.unused_nb),
+            used_device_roots=self.used_device_roots,
+            trail=self.trail,
+            add_actions=self.add_actions,
+            zhash=self.zhash,
+            num_adds=self.num_adds,
         )
 
-    def hash_key(self) -> Tuple[str, Tuple[Edge, ...]]:
-        return (self.current_pin, tuple(sorted(self.visited_edges)))
+    def __reduce__(self):
+        # Masks index the process-local edge allocator, so pickle edges and re-intern on load
+        return (_unpickle_state, (self.current_pin, self.start_pin, self.adjacency,
+                                  self.visited_edges, self.used_device_roots, self.seq))
+
+    def hash_key(self) -> StateKey:
+        """Transposition key: Zobrist hash of the current pin, every edge in the graph, and the visited subset."""
+        return self.zhash
+
+    def same_position(self, other: "EulerState") -> bool:
+        """Exact check behind hash_key (seq is ignored); callers use it to reject 64-bit collisions."""
+        return (self.current_pin == other.current_pin and self.exists_mask == other.exists_mask
+                and self.visited_mask == other.visited_mask)
 
 # ---- MCTS (PUCT) ----
 
-@dataclass
-class Node:
-    state: EulerState
-    prior: float = 0.0
-    N: int = 0
-    W: float = 0.0
-    Q: float = 0.0
-    children: Dict[str, "Node"] = field(default_factory=dict)
+def _unpickle_state(current_pin, start_pin, adjacency, visited, roots, seq) -> EulerState:
+    mask = 0
+    for e in visited:
+        mask |= _edge_bit(e)
+    trail = None
+    for a in seq:
+        trail = (trail, a)
+    return EulerState(current_pin=current_pin, start_pin=start_pin, adjacency=adjacency,
+                      visited_mask=mask, used_device_roots=roots, trail=trail)
+
+# Per-node hot fields, interleaved so one child's N/W/P share a cache line and a child
+# block's records sit in consecutive bytes (20 B each).
+NODE_DTYPE = np.dtype([
+    ("N", np.int32),
+    ("W", np.float32),
+    ("P", np.float32),
+    ("parent", np.int32),
+    ("action", np.int32),
+])
+
+class TreeArrays:
+    """
+    Array-backed search tree. Node i's statistics live at index i: visit_count, total_value,
+    prior, parent_idx and action_id are field views into one NODE_DTYPE record array (`nodes`);
+    first_child_idx/num_children are plain arrays. Children of node i occupy the contiguous
+    block [first_child_idx[i], first_child_idx[i] + num_children[i]). expanded[i] records that
+    node i's legal actions were already enumerated, so leaves with none are not re-expanded.
+    children_N[i] is the running visit total of the block node i allocated (blocks can be
+    shared by transposed nodes, so a block's owner is parent_idx of any of its children).
+    Every visit to a node with a parent is added to its owner's total, including visits to a
+    run() root that already sits inside a block, so children_N[i] always equals the block's
+    visit_count sum, also for trees reused across run() calls.
+    ongoing/children_O are the same pair for WU-UCT's in-flight simulation counts.
+    States are kept in a parallel Python list since they are not numeric, and are only
+    materialized (applied from the parent's state) the first time a child is visited.
+    """
+
+    RECORD_VIEWS = (("visit_count", "N"), ("total_value", "W"), ("prior", "P"),
+                    ("parent_idx", "parent"), ("action_id", "action"))
+    __slots__ = ("size", "capacity", "states", "nodes", "first_child_idx", "num_children", "children_N",
+                 "ongoing", "children_O", "expanded") + tuple(
+        name for name, _ in RECORD_VIEWS)
+
+    def __init__(self, max_nodes: int = 4096):
+        self.size = 0
+        self.capacity = max_nodes
+        self.nodes = self._empty_records(max_nodes)
+        self.first_child_idx = np.full(max_nodes, -1, dtype=np.int32)
+        self.num_children = np.zeros(max_nodes, dtype=np.int32)
+        self.children_N = np.zeros(max_nodes, dtype=np.int32)
+        self.ongoing = np.zeros(max_nodes, dtype=np.int32)
+        self.children_O = np.zeros(max_nodes, dtype=np.int32)
+        self.expanded = np.zeros(max_nodes, dtype=np.bool_)
+        self._bind_views()
+        self.states: List[Optional[EulerState]] = []
+
+    @staticmethod
+    def _empty_records(n: int) -> np.ndarray:
+        rec = np.zeros(n, dtype=NODE_DTYPE)
+        rec["parent"] = -1
+        rec["action"] = -1
+        return rec
+
+    def _bind_views(self) -> None:
+        for name, field_name in self.RECORD_VIEWS:
+            setattr(self, name, self.nodes[field_name])
+
+    def _reserve(self, n: int) -> None:
+        if self.size + n <= self.capacity:
+            return
+        new_cap = max(2 * self.capacity, self.size + n)
+        nodes = self._empty_records(new_cap)
+        nodes[:self.size] = self.nodes[:self.size]
+        self.nodes = nodes
+        for name, fill, dtype in (("first_child_idx", -1, np.int32), ("num_children", 0, np.int32),
+                                  ("children_N", 0, np.int32), ("ongoing", 0, np.int32),
+                                  ("children_O", 0, np.int32), ("expanded", False, np.bool_)):
+            arr = np.full(new_cap, fill, dtype=dtype)
+            arr[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, arr)
+        self._bind_views()
+        self.capacity = new_cap
+
+    def add_node(self, state: EulerState, prior: float = 1.0) -> int:
+        self._reserve(1)
+        i = self.size
+        self.prior[i] = prior
+        self.states.append(state)
+        self.size += 1
+        return i
+
+    def add_children(self, parent: int, priors: List[float], action_ids: List[int]) -> int:
+        """Allocate a contiguous child block under `parent`; returns the first child's index."""
+        n = len(action_ids)
+        self._reserve(n)
+        start = self.size
+        end = start + n
+        self.prior[start:end] = priors
+        self.action_id[start:end] = action_ids
+        self.parent_idx[start:end] = parent
+        self.first_child_idx[parent] = start
+        self.num_children[parent] = n
+        self.states.extend([None] * n)
+        self.size = end
+        return start
+
+    def state(self, i: int) -> EulerState:
+        """State of node i, applied from its parent's state on first access."""
+        s = self.states[i]
+        if s is None:
+            s = self.state(int(self.parent_idx[i])).apply(int(self.action_id[i]))
+            self.states[i] = s
+        return s
 
 class MCTS:
-    def __init__(self, c_puct: float = 1.5, num_simulations: int = 200, policy=None, rng: Optional[random.Random]=None):
+    def __init__(self, c_puct: float = 1.5, num_simulations: int = 200, policy=None, rng: Optional[random.Random]=None,
+                 batch_size: int = 1, virtual_loss: float = 1.0, reward_cache_size: int = 100_000,
+                 wu_uct: bool = False, root_noise: float = 0.0, dirichlet_alpha: float = 0.3):
         self.c_puct = c_puct
         self.num_simulations = num_simulations
-        self.policy = policy  # optional callable: (state, actions)-> priors dict
+        self.policy = policy  # optional callable: (state, packed actions) -> priors dict
         self.rng = rng or random.Random(0)
-        self.table: Dict[Tuple[str, Tuple[Edge,...]], Node] = {}
+        self.batch_size = max(1, batch_size)  # leaves collected per batch; rollouts run in a thread pool when > 1
+        self.virtual_loss = virtual_loss
+        # WU-UCT: batched leaves are tracked as ongoing (O) counts in the exploration term
+        # instead of a virtual loss on W; see _select
+        self.wu_uct = wu_uct
+        # Fraction of Dirichlet(dirichlet_alpha) noise, drawn from self.rng, mixed into the root's
+        # priors when it is expanded. Selection and rollouts are otherwise deterministic, so this
+        # is what makes searches with different seeds explore differently (see run_parallel).
+        # Only a freshly expanded root is noised: a root reused from an earlier run() keeps the
+        # priors its block was allocated with.
+        self.root_noise = root_noise
+        self.dirichlet_alpha = dirichlet_alpha
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.tree = TreeArrays()
+        # sqrt(total_N) lookup; total_N is usually bounded by num_simulations (+1 for the prior term),
+        # but trees reused across run() calls can outgrow it, so _select falls back to math.sqrt
+        self._sqrt: List[float] = [math.sqrt(i) for i in range(num_simulations + 2)]
+        # Transposition table: state key -> node id owning that state's child block
+        self.table: Dict[StateKey, int] = {}
+        # Rollout rewards by terminal state (LRU-bounded); see _reward_key
+        self.reward_cache: "OrderedDict[RewardKey, float]" = OrderedDict()
+        self.reward_cache_size = reward_cache_size
 
-    def run(self, root_state: EulerState) -> Node:
-        root_key = root_state.hash_key()
-        root = self.table.get(root_key)
-        if root is None:
-            root = Node(state=root_state, prior=1.0)
-            self.table[root_key] = root
-
-        for _ in range(self.num_simulations):
-            path: List[Tuple[Node, str]] = []
-            node = root
-            # SELECTION
-            while True:
-                actions = node.state.legal_actions()
-                if not actions:
-                    break
-                if not node.children:
-                    break
-                # pick child with max Q + U
-                total_N = sum(ch.N for ch in node.children.values()) + 1
-                best_a, best_child, best_score = None, None, -1e9
-                for a, ch in node.children.items():
-                    P = ch.prior if ch.prior is not None else 0.0
-                    U = self.c_puct * P * math.sqrt(total_N) / (1 + ch.N)
-                    score = ch.Q + U
-                    if score > best_score:
-                        best_a, best_child, best_score = a, ch, score
-                path.append((node, best_a))
-                node = best_child
-                if node is None:
-                    break
-                if best_a == "END":
-                    break
-
-                # continue until expansion point
-                if not node.children:
-                    break
-
-            # EXPANSION
-            if node.children == {}:
-                acts = node.state.legal_actions()
-                if acts:
-                    priors = self._priors(node.state, acts)
-                    for a in acts:
-                        next_state = node.state.apply(a)
-                        ch = Node(state=next_state, prior=priors.get(a, 1.0 / max(1, len(acts))))
-                        node.children[a] = ch
-                        path.append((node, a))
-                        node = ch
-                        break  # expand only one child per sim
-
-            # SIMULATION
-            reward = self._rollout(node.state)
+    def run(self, root_state: EulerState) -> int:
+        """Run simulations from `root_state`; returns the root's node id in `self.tree`."""
+        tree = self.tree
+        root = self._root(root_state)
+
+        done = 0
+        while done < self.num_simulations:
+            B = min(self.batch_size, self.num_simulations - done)
+            # Virtual loss / ongoing counts only matter when several leaves are in flight at once
+            wu = self.wu_uct and B > 1
+            vloss = self.virtual_loss if B > 1 and not wu else 0.0
+            # SELECTION/EXPANSION + SIMULATION
+            if B == 1:
+                paths = [self._descend(root, vloss)]
+                rewards = [self._rollout(tree.state(paths[0][-1]))]
+            else:
+                # Virtual loss or O counts (applied by _descend) steer the B selections apart. The playout
+                # walk is cheap Python and stays on this thread; only score_circuit (the SPICE
+                # call) goes to the pool, so leaves are scored while later ones are selected.
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.batch_size)
+                paths, pending = [], []
+                for _ in range(B):
+                    path = self._descend(root, vloss, wu)
+                    s = tree.state(path[-1]).copy()
+                    self._playout(s)
+                    paths.append(path)
+                    key = self._reward_key(s)
+                    hit = self._cached_reward(key)
+                    pending.append((key, self._pool.submit(score_circuit, s) if hit is None else hit))
+                rewards = []
+                for key, r in pending:
+                    if isinstance(r, Future):
+                        r = r.result()
+                        self._store_reward(key, r)
+                    rewards.append(r)
 
             # BACKUP
-            # (single-player optimization problem → same reward for path)
-            for n, _a in path:
-                n.N += 1
-                n.W += reward
-                n.Q = n.W / n.N
+            # (single-player optimization problem → same reward along the path; the tree
+            # is a DAG once transpositions are shared, so follow the path, not parent_idx)
+            for path, reward in zip(paths, rewards):
+                if wu:
+                    self._mark_ongoing(path, -1)
+                    self._backup(path, 1, reward)
+                else:
+                    self._backup(path, 0, reward + vloss)
+            done += B
 
         return root
 
-    def best_action(self, root: Node, temperature: float = 1e-9) -> str:
+    def run_parallel(self, root_state: EulerState, n_workers: int = 2,
+                     root_noise: Optional[float] = None) -> int:
+        """
+        Root parallelism: run `n_workers` independent searches from `root_state` in worker
+        processes, then sum their root-child N and W into this tree's root. Returns the root's
+        node id, ready for best_action().
+        Each worker seeds its own rng and mixes `root_noise` (default: self.root_noise)
+        Dirichlet noise into its root priors; that noise is the only thing that makes the
+        workers' trees differ (with root_noise=0, the MCTS default, every worker repeats the
+        same deterministic search; 0.25 is a typical setting). Workers start from fresh trees, so their roots are always noised; this
+        tree's root keeps un-noised priors. Settings, including `policy`, are sent to the
+        workers by pickling, so a policy must be picklable (e.g. a module-level function).
+        """
+        if root_noise is None:
+            root_noise = self.root_noise
+        seeds = [self.rng.randrange(2**31) for _ in range(n_workers)]
+        settings = dict(c_puct=self.c_puct, num_simulations=self.num_simulations, policy=self.policy,
+                        batch_size=self.batch_size, virtual_loss=self.virtual_loss,
+                        reward_cache_size=self.reward_cache_size, wu_uct=self.wu_uct,
+                        root_noise=root_noise, dirichlet_alpha=self.dirichlet_alpha)
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            results = list(ex.map(_root_child_stats, [(root_state, seed, settings) for seed in seeds]))
+
+        tree = self.tree
+        root = self._root(root_state)
+        owner = int(tree.parent_idx[root])  # root's own block, if it is a reused child
+        if not tree.expanded[root]:
+            tree.expanded[root] = True
+            acts = root_state.legal_actions()
+            if acts:
+                tree.add_children(root, self._priors(root_state, acts), acts)
+        start = int(tree.first_child_idx[root])
+        slot = {int(tree.action_id[start + k]): start + k for k in range(int(tree.num_children[root]))}
+        for stats in results:
+            for action, (n, w) in stats.items():
+                i = slot.get(action)
+                if i is None:  # policy-dependent action sets may differ
+                    continue
+                tree.visit_count[i] += n
+                tree.total_value[i] += w
+                tree.children_N[root] += n
+                tree.visit_count[root] += n
+                tree.total_value[root] += w
+                if owner >= 0:
+                    tree.children_N[owner] += n
+        return root
+
+    def _lookup(self, state: EulerState) -> Optional[int]:
+        """Transposition-table node for `state`'s position, or None (a Zobrist collision counts as a miss)."""
+        owner = self.table.get(state.hash_key())
+        if owner is not None and not self.tree.state(owner).same_position(state):
+            return None
+        return owner
+
+    def _root(self, root_state: EulerState) -> int:
+        root = self._lookup(root_state)
+        if root is None:
+            root = self.tree.add_node(root_state, prior=1.0)
+            self.table[root_state.hash_key()] = root
+        return root
+
+    def _descend(self, root: int, vloss: float, ongoing: bool = False) -> List[int]:
+        """
+        Select and expand one leaf. Expansion allocates the node's whole child block (a prior
+        for every legal action) and immediately selects into it, so the returned path ends at
+        the new child and that leaf is backed up along with its ancestors. Along the path,
+        either counts the visit and applies `vloss`, or (`ongoing`, WU-UCT) only marks the
+        simulation as in flight.
+        """
+        tree = self.tree
+        node = root
+        path = [root]
+        # SELECTION: descend by max Q + U until an unexpanded node or END
+        while tree.num_children[node] > 0:
+            node = int(tree.first_child_idx[node]) + self._select(node)
+            path.append(node)
+            if tree.action_id[node] == ACT_END:
+                break
+
+        # EXPANSION: share a transposed child block if one exists, else allocate a new one.
+        # Runs once per node: a node left without children stays a leaf and is not re-enumerated.
+        if not tree.expanded[node] and tree.action_id[node] != ACT_END:
+            tree.expanded[node] = True
+            state = tree.state(node)
+            acts = state.legal_actions()
+            if len(path) > 1:
+                # Forced moves below the root: advance this node's own state rather than growing
+                # a chain of one-child nodes. A lone END is left to the rollout (the node stays a leaf).
+                while len(acts) == 1 and acts[0] != ACT_END:
+                    state = state.apply(acts[0])
+                    tree.states[node] = state
+                    acts = state.legal_actions()
+                if acts == [ACT_END]:
+                    acts = []
+            if acts:
+                key = state.hash_key()
+                owner = self._lookup(state)
+                # No-op transitions (e.g. re-ADDing an existing edge) keep the position; never link those,
+                # since sharing the parent's own block would turn the DAG into a cycle.
+                noop = len(path) > 1 and tree.states[path[-2]].same_position(state)
+                if owner is not None and owner != node and tree.num_children[owner] > 0 and not noop:
+                    tree.first_child_idx[node] = tree.first_child_idx[owner]
+                    tree.num_children[node] = tree.num_children[owner]
+                else:
+                    if owner is None or tree.num_children[owner] == 0:
+                        self.table[key] = node
+                    priors = self._priors(state, acts)
+                    if node == root and self.root_noise > 0.0:
+                        priors = self._noisy(priors)
+                    tree.add_children(node, priors, acts)
+                node = int(tree.first_child_idx[node]) + self._select(node)
+                path.append(node)
+
+        if ongoing:
+            self._mark_ongoing(path, 1)
+        else:
+            self._backup(path, 1, -vloss)
+        return path
+
+    def _backup(self, path: List[int], dN: int, dW: float) -> None:
+        """Add dN visits and dW value along a root→leaf path (no Python per-node loop)."""
+        tree = self.tree
+        idx = np.array(path, dtype=np.int32)
+        if HAVE_KERNELS:
+            backup_path(idx, tree.visit_count, tree.total_value, tree.parent_idx, tree.children_N, dN, dW)
+        else:
+            # a DAG path never repeats a node (nor a block), so plain fancy-index updates are safe
+            tree.visit_count[idx] += dN
+            tree.total_value[idx] += dW
+            owners = tree.parent_idx[idx]
+            tree.children_N[owners[owners >= 0]] += dN
+
+    def _mark_ongoing(self, path: List[int], dO: int) -> None:
+        """Add dO in-flight simulations along a root→leaf path (WU-UCT's O counts)."""
+        tree = self.tree
+        idx = np.array(path, dtype=np.int32)
+        if HAVE_KERNELS:
+            # same per-node + per-block update as visits; the 0.0 value delta leaves W untouched
+            backup_path(idx, tree.ongoing, tree.total_value, tree.parent_idx, tree.children_O, dO, 0.0)
+        else:
+            tree.ongoing[idx] += dO
+            owners = tree.parent_idx[idx]
+            tree.children_O[owners[owners >= 0]] += dO
+
+    def _select(self, node: int) -> int:
+        """
+        Offset (within the child block) of the child maximizing Q + U. Blocks are laid out in
+        legal_actions() order, which is deterministic, so ties simply go to the first child.
+        """
+        tree = self.tree
+        start = tree.first_child_idx[node]
+        c = slice(start, start + tree.num_children[node])
+        N = tree.visit_count[c]
+        W = tree.total_value[c]
+        owner = tree.parent_idx[start]
+        total_N = int(tree.children_N[owner]) + 1  # == N.sum() + 1; see TreeArrays
+        if self.wu_uct:
+            # WU-UCT: Q + c * P * sqrt(N_parent + O_parent) / (1 + N + O)
+            total_N += int(tree.children_O[owner])
+        sq = self.c_puct * (self._sqrt[total_N] if total_N < len(self._sqrt) else math.sqrt(total_N))
+        if self.wu_uct:
+            O = tree.ongoing[c]
+            if HAVE_KERNELS:
+                return select_child_wu(tree.prior[c], N, W, O, sq)
+            q = np.divide(W, N, out=np.zeros(len(N), dtype=np.float32), where=N > 0)
+            return int(np.argmax(q + sq * tree.prior[c] / (1 + N + O)))
+        if HAVE_KERNELS:
+            return select_child_ucb(tree.prior[c], N, W, sq)
+        q = np.divide(W, N, out=np.zeros(len(N), dtype=np.float32), where=N > 0)
+        u = sq * tree.prior[c] / (1 + N)
+        return int(np.argmax(q + u))
+
+    def best_action(self, root: int, temperature: float = 1e-9) -> int:
         # pick child by visit count (or greedy Q if tie)
-        if not root.children:
-            return "END"
+        tree = self.tree
+        n = int(tree.num_children[root])
+        if n == 0:
+            return ACT_END
+        start = int(tree.first_child_idx[root])
+        visits = tree.visit_count[start:start + n]
         if temperature <= 1e-8:
-            return max(root.children.items(), key=lambda kv: kv[1].N)[0]
-        # soft sample by N^1/T
-        items = list(root.children.items())
-        weights = [pow(ch.N + 1e-6, 1.0 / temperature) for _, ch in items]
-        total = sum(weights)
-        r = self.rng.random() * total
-        acc = 0.0
-        for (a, ch), w in zip(items, weights):
-            acc += w
-            if r <= acc:
-                return a
-        return items[-1][0]
-
-    def _priors(self, state: EulerState, actions: List[str]) -> Dict[str, float]:
+            return int(tree.action_id[start + int(np.argmax(visits))])
+        # soft sample by N^1/T: one uniform draw against the cumulative weights
+        cum = np.cumsum((visits + 1e-6) ** (1.0 / temperature))
+        k = int(np.searchsorted(cum, self.rng.random() * cum[-1]))
+        return int(tree.action_id[start + min(k, n - 1)])
+
+    def _priors(self, state: EulerState, actions: List[int]) -> List[float]:
+        """Child priors in `actions` order."""
+        n = len(actions)
         if self.policy is None:
-            # Uniform priors with a small bias to END when legal
-            priors = {a: 1.0 for a in actions}
-            if "END" in priors:
-                priors["END"] = 2.0
-            s = sum(priors.values())
-            return {k: v / s for k, v in priors.items()}
-        return self.policy(state, actions)
+            # Uniform priors with a small bias to END when legal (END is always listed last)
+            has_end = actions[-1] == ACT_END
+            denom = n + 1.0 if has_end else float(n)
+            priors = [1.0 / denom] * n
+            if has_end:
+                priors[-1] = 2.0 / denom
+            return priors
+        priors = self.policy(state, actions)
+        default = 1.0 / n
+        return [priors.get(a, default) for a in actions]
 
     def _rollout(self, state: EulerState, max_steps: int = 64) -> float:
-        """Greedy-on-priors rollout until END or cap, then score with PySpice if possible."""
-        s = state.copy()
+        """
+        Greedy-on-priors rollout until END or cap, then score with PySpice if possible.
+        Mutates `state` in place and unwinds it through the undo log before returning.
+        """
+        undo_log = self._playout(state, max_steps)
+        # Reward from SPICE confirmation (or heuristic fallback), unless this end state was seen
+        key = self._reward_key(state)
+        reward = self._cached_reward(key)
+        if reward is None:
+            reward = score_circuit(state)
+            self._store_reward(key, reward)
+        while undo_log:
+            state.undo(undo_log.pop())
+        return reward
+
+    @staticmethod
+    def _reward_key(state: EulerState) -> RewardKey:
+        # score_circuit reads the graph, the trail closure and the number of ADD actions. Keyed on
+        # the exact masks, not zhash: there is no same_position() check on a hit, so a Zobrist
+        # collision would silently return another position's reward.
+        return state.current_pin, state.start_pin, state.exists_mask, state.visited_mask, state.num_adds
+
+    def _cached_reward(self, key: RewardKey) -> Optional[float]:
+        r = self.reward_cache.get(key)
+        if r is not None:
+            self.reward_cache.move_to_end(key)
+        return r
+
+    def _store_reward(self, key: RewardKey, reward: float) -> None:
+        cache = self.reward_cache
+        cache[key] = reward
+        if len(cache) > self.reward_cache_size:
+            cache.popitem(last=False)
+
+    def _noisy(self, priors: List[float]) -> List[float]:
+        """(1 - eps) * P + eps * Dirichlet(alpha) noise, eps = root_noise, drawn from self.rng."""
+        eta = [self.rng.gammavariate(self.dirichlet_alpha, 1.0) for _ in priors]
+        total = sum(eta) or 1.0
+        eps = self.root_noise
+        return [(1.0 - eps) * p + eps * e / total for p, e in zip(priors, eta)]
+
+    def _playout(self, s: EulerState, max_steps: int = 64) -> List[Tuple]:
+        """Advance `s` in place by the rollout policy; returns the undo log."""
+        undo_log = []
         for _ in range(max_steps):
             acts = s.legal_actions()
             if not acts:
                 break
-            if "END" in acts and s.is_complete() and s.current_pin == s.start_pin:
-                s = s.apply("END")
+            if acts[-1] == ACT_END:  # only offered once the trail is complete and closed
+                undo_log.append(s.apply_inplace(ACT_END))
                 break
             # simple heuristic: prefer moving over adding when possible
-            move_acts = [a for a in acts if not a.startswith("ADD:") and a != "END"]
-            a = move_acts[0] if move_acts else acts[0]
-            s = s.apply(a)
-        # Reward from SPICE confirmation (or heuristic fallback)
-        from .netlist_io import score_circuit
-        return score_circuit(s)
+            a = acts[0]  # moves come first in legal_actions()
+            undo_log.append(s.apply_inplace(a))
+        return undo_log
 
+def _root_child_stats(job) -> Dict[int, Tuple[int, float]]:
+    """run_parallel worker: one independent search, reduced to root child action -> (N, W)."""
+    root_state, seed, settings = job
+    mcts = MCTS(rng=random.Random(seed), **settings)
+    tree = mcts.tree
+    root = mcts.run(root_state)
+    start = int(tree.first_child_idx[root])
+    return {
+        int(tree.action_id[i]): (int(tree.visit_count[i]), float(tree.total_value[i]))
+        for i in range(start, start + int(tree.num_children[root]))
+    }
@@ -10,7 +10,10 @@ netlist from the partial/strange topology, we return a low reward.
 
 from __future__ import annotations
 from typing import List, Tuple, Optional, Dict, Set
+from functools import lru_cache
 import math
+import numpy as np
+from .vocab import STOI
 
 try:
     import PySpice.Logging.Logging as Logging  # type: ignore
@@ -23,17 +26,17 @@ except Exception:
 
 def _contains_supply_loop(state) -> bool:
     # Very rough check: any visited edge touches both VDD and VSS components via multiple steps.
-    touched_vdd = "VDD" in state.adjacency and len(state.adjacency["VDD"]) > 0
-    touched_vss = "VSS" in state.adjacency and len(state.adjacency["VSS"]) > 0
-    return touched_vdd and touched_vss and len(state.visited_edges) >= 3
+    touched_vdd = len(state.adjacency.get(STOI["VDD"], ())) > 0
+    touched_vss = len(state.adjacency.get(STOI["VSS"], ())) > 0
+    return touched_vdd and touched_vss and state.num_visited() >= 3
 
 def _heuristic_reward(state) -> float:
     # Simple topological score: more visited edges, plus bonus for touching both supplies and closing a trail.
-    score = 0.1 * len(state.visited_edges)
+    score = 0.1 * state.num_visited()
     if _contains_supply_loop(state): score += 1.0
     if state.is_complete() and state.current_pin == state.start_pin: score += 0.5
     # Small regularizer for fewer ADDs
-    add_ops = sum(1 for s in state.seq if isinstance(s, str) and s.startswith("ADD:"))
+    add_ops = state.num_adds
     score -= 0.01 * add_ops
     return max(0.0, score)
 
@@ -55,14 +58,32 @@ def _simulate_gain(circuit: "Circuit") -> Optional[float]:
         simulator = circuit.simulator(temperature=25, nominal_temperature=25)
         ac = simulator.ac(start_frequency=1@k, stop_frequency=10@M, number_of_points=10, variation='dec')
         # Measure |V(OUT)/V(IN)|
-        import numpy as np  # local import
-        vin = ac['IN']
-        vout = ac['OUT']
-        mag = np.abs(vout / vin)
-        return float(np.max(mag))
+        vin = np.asarray(ac['IN'])
+        vout = np.asarray(ac['OUT'])
+        # Compare squared magnitudes (no complex divide, no per-point sqrt); one sqrt at the argmax
+        ratio_sq = (vout.real * vout.real + vout.imag * vout.imag) / (vin.real * vin.real + vin.imag * vin.imag)
+        idx = int(np.argmax(ratio_sq))
+        return float(np.sqrt(ratio_sq[idx]))
     except Exception:
         return None
 
+@lru_cache(maxsize=1)
+def _toy_inverter_gain() -> Optional[float]:
+    """
+    The toy inverter is a fixed circuit (it does not depend on the state), so its AC
+    gain is simulated once per process. A state-derived netlist should instead be
+    cached on a hash of that netlist.
+    Known issue: the PySpice import block above never succeeds as written (there is no
+    PySpice.Documentation module and PySpice.Unit has no bare m/k/M/V/Ohm), so HAVE_PYSPICE
+    is always False and this cache only ever holds None. Enabling the SPICE path is a
+    separate change, since it would replace the heuristic reward for every state that
+    passes _contains_supply_loop.
+    """
+    circ = _toy_inverter_circuit()
+    if circ is None:
+        return None
+    return _simulate_gain(circ)
+
 def score_circuit(state) -> float:
     """
     Returns a scalar reward. Strategy:
@@ -71,13 +92,11 @@ def score_circuit(state) -> float:
     2) Otherwise, return a robust heuristic based on topology features (touching supplies, edges, closure).
     """
     if HAVE_PYSPICE and _contains_supply_loop(state):
-        circ = _toy_inverter_circuit()
-        if circ is not None:
-            gain = _simulate_gain(circ)
-            if gain is not None:
-                # Compress gain to a [0, ~2] scale with log-ish mapping
-                reward = min(2.0, math.log1p(gain))
-                return reward
+        gain = _toy_inverter_gain()
+        if gain is not None:
+            # Compress gain to a [0, ~2] scale with log-ish mapping
+            reward = min(2.0, math.log1p(gain))
+            return reward
 
     # Fallback: heuristic
     return _heuristic_reward(state)
@@ -22,7 +22,7 @@ Special tokens: VDD, VSS, END
 """
 
 from __future__ import annotations
-from typing import Dict, List, Tuple, Set, DefaultDict
+from typing import Dict, List, Tuple, Set, FrozenSet, DefaultDict
 from collections import defaultdict
 
 SPECIAL_TOKENS = ["VDD", "VSS", "END"]  # END is the termination token for MCTS
@@ -67,27 +67,74 @@ def build_tokens() -> Tuple[List[str], Dict[str, int], Dict[int, str]]:
 TOKENS, STOI, ITOS = build_tokens()
 VOCAB_SIZE = len(TOKENS)
 
+def _pins_by_root(tokens: List[str]) -> Dict[str, Tuple[str, ...]]:
+    by_root: DefaultDict[str, List[str]] = defaultdict(list)
+    for t in tokens:
+        if "_" in t:
+            by_root[t.split("_", 1)[0]].append(t)
+    return {root: tuple(pins) for root, pins in by_root.items()}
+
+# 'NM3' -> ('NM3_D', 'NM3_G', 'NM3_S', 'NM3_B'), in TOKENS order
+PINS_BY_ROOT: Dict[str, Tuple[str, ...]] = _pins_by_root(TOKENS)
+
+# Precomputed over the whole vocabulary so the helpers below are a single dict/set probe
+ROOT: Dict[str, str] = {t: t.split("_", 1)[0] if "_" in t else t for t in TOKENS}
+PIN_TOKENS: FrozenSet[str] = frozenset(t for t in TOKENS if "_" in t and t not in ("VDD", "VSS", "END"))
+
 def device_root(pin: str) -> str:
     """Map 'NM3_G' -> 'NM3'; 'R4_P' -> 'R4'; 'VDD' -> 'VDD'."""
-    if "_" in pin:
-        return pin.split("_", 1)[0]
-    return pin
+    root = ROOT.get(pin)
+    if root is None:  # not a vocabulary token
+        return pin.split("_", 1)[0] if "_" in pin else pin
+    return root
 
 def is_pin_token(tok: str) -> bool:
-    return "_" in tok and tok not in ("VDD", "VSS", "END")
-
-def initial_adjacency() -> Dict[str, List[str]]:
+    if tok in ROOT:
+        return tok in PIN_TOKENS
+    return "_" in tok
+
+# Packed search actions: kind in the low 2 bits, STOI pin id above them.
+# END packs to 0; MOVE to a neighbor pin is ACT_MOVE | id << 2; attaching a pin is ACT_ADD | id << 2.
+ACT_END, ACT_MOVE, ACT_ADD = 0, 1, 2
+
+def encode_action(action: str) -> int:
+    """'END' / '<pin>' / 'ADD:<pin>' -> packed int."""
+    if action == "END":
+        return ACT_END
+    if action.startswith("ADD:"):
+        return ACT_ADD | STOI[action[4:]] << 2
+    return ACT_MOVE | STOI[action] << 2
+
+def decode_action(a: int) -> str:
+    """Packed int -> 'END' / '<pin>' / 'ADD:<pin>' (for logging and export)."""
+    kind = a & 3
+    if kind == ACT_END:
+        return "END"
+    return ("ADD:" if kind == ACT_ADD else "") + ITOS[a >> 2]
+
+_INITIAL_ADJACENCY: Dict[str, Tuple[str, ...]] = {"VDD": (), "VSS": ()}
+
+def initial_adjacency() -> Dict[str, Tuple[str, ...]]:
     """
     Start with a minimal graph containing only supplies.
     We treat supplies as nodes that can connect to any device pin during generation.
     """
-    return {"VDD": [], "VSS": []}
+    return dict(_INITIAL_ADJACENCY)
+
+def add_edge(adj: Dict[str, Tuple[str, ...]], a: str, b: str) -> None:
+    """Neighbor tuples are replaced, never mutated, so adjacency copies can share them."""
+    nbs = adj.get(a, ())
+    if b not in nbs: adj[a] = (*nbs, b)
+    nbs = adj.get(b, ())
+    if a not in nbs: adj[b] = (*nbs, a)
+
+def add_new_edge(adj: Dict[str, Tuple[str, ...]], a: str, b: str) -> None:
+    """add_edge for an edge the caller knows is absent: appends without scanning the neighbor tuples."""
+    adj[a] = (*adj.get(a, ()), b)
+    if a != b:
+        adj[b] = (*adj.get(b, ()), a)
 
-def add_edge(adj: Dict[str, List[str]], a: str, b: str) -> None:
-    if a not in adj: adj[a] = []
-    if b not in adj: adj[b] = []
-    if b not in adj[a]: adj[a].append(b)
-    if a not in adj[b]: adj[b].append(a)
+_BASE_ROOTS = ("NM1", "PM1", "R1", "C1", "INVERTER1")
 
 def all_candidate_new_pins(used_devices: Set[str]) -> List[str]:
     """
@@ -96,18 +143,12 @@ def all_candidate_new_pins(used_devices: Set[str]) -> List[str]:
     plus any devices already started (to continue wiring them).
     You can broaden this later.
     """
-    candidates: List[str] = []
     # Always allow first few MOSFET pins; expand library as needed.
-    for base in ["NM1", "PM1", "R1", "C1", "INVERTER1"]:
-        for p in TOKENS:
-            if p.startswith(base + "_"):
-                candidates.append(p)
-    # If any device roots already used, expose their remaining pins
+    candidates: List[str] = [p for base in _BASE_ROOTS for p in PINS_BY_ROOT[base]]
+    # If any device roots already used, expose their remaining pins (roots never share pins)
     for root in sorted(used_devices):
-        for p in TOKENS:
-            if p.startswith(root + "_") and p not in candidates:
-                candidates.append(p)
+        if root not in _BASE_ROOTS:
+            candidates.extend(PINS_BY_ROOT.get(root, ()))
     # Also allow connecting to VDD/VSS directly
     candidates.extend(["VDD", "VSS"])
-    # Remove END if present
-    return [c for c in candidates if c != "END"]
+    return candidates